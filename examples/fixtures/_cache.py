@@ -0,0 +1,55 @@
+import functools
+import inspect
+import os
+import pickle
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def load_cached(parse: Callable[..., T], *paths: str) -> T:
+    """Parse the fixture files in `paths` with `parse`, caching the result.
+
+    Results are memoized in memory and pickled next to the first file, keyed
+    by the modification time and size of every file and of the module
+    defining `parse`. Editing a fixture or its loader invalidates both
+    layers. The cached objects are returned as is, callers
+    must not mutate them.
+    """
+    sources = paths + (inspect.getfile(parse),)
+    stamps = tuple(
+        (stat.st_mtime_ns, stat.st_size) for stat in map(os.stat, sources))
+    return _load(parse, paths, stamps)
+
+
+@functools.lru_cache(maxsize=None)
+def _load(parse: Callable[..., T], paths: "tuple[str]", stamps: tuple) -> T:
+    cache = Path(f"{paths[0]}.{parse.__name__}.pkl")
+
+    if cache.exists():
+        try:
+            cached_stamps, result = pickle.loads(cache.read_bytes())
+        except (pickle.UnpicklingError, EOFError, ValueError,
+                AttributeError, ImportError):
+            # Truncated or written by another version, parse again
+            pass
+        else:
+            if cached_stamps == stamps:
+                return result
+
+    result = parse(*paths)
+    # Write to a temporary file first, an interrupted write never leaves a
+    # truncated cache behind
+    partial = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        partial.write_bytes(
+            pickle.dumps((stamps, result), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(partial, cache)
+    except OSError:  # read-only checkout, keep the in-memory layer only
+        try:
+            partial.unlink()
+        except OSError:
+            pass
+
+    return result
@@ -0,0 +1,44 @@
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import ijson
+    # The pure python backends are slower than decoding the whole file
+    if ijson.backend != "yajl2_c":
+        ijson = None
+except ImportError:
+    ijson = None
+
+
+def load_json(path: str):
+    """Decode a JSON fixture, using orjson when it is available. orjson
+    decodes straight from a read-only memory map of the file."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            # An empty file cannot be mapped, let orjson report it
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                return orjson.loads(view)
+
+    with open(path, "r", encoding="UTF-8") as f:
+        return json.load(f)
+
+
+def iter_items(path: str):
+    """Iterate over the items of a JSON array fixture. With ijson (and its C
+    backend) installed the items are decoded one at a time, so the whole
+    array never needs to be held in memory."""
+    if ijson is None:
+        yield from load_json(path)
+        return
+
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
@@ -0,0 +1,11 @@
+"""Outcome tables shared by the fixture loaders. Lookups are bound dict.get
+methods, called as `chess_outcome(result, DRAW)`; every row of a fixture
+shares the same outcome tuples."""
+
+DRAW = (0.5, 0.5)
+
+# Chess result string to win-loss outcome format
+chess_outcome = {"1-0": (1, 0), "0-1": (0, 1)}.get
+
+# Chatbot arena winner field to win-loss outcome format
+arena_outcome = {"model_a": (1, 0), "model_b": (0, 1)}.get
@@ -1,43 +1,70 @@
-import json
+from array import array
+from itertools import chain
 from os.path import dirname
+from sys import intern
 
+import numpy as np
 from popcore import Interaction
+from poprank.utils import InteractionBatch
 
+from .._cache import load_cached
+from .._io import iter_items
+from .._outcome import DRAW, chess_outcome
 
-def str_to_outcome(s: str):
-    if s == "1-0":
-        return 1, 0
-    if s == "0-1":
-        return 0, 1
-    return 0.5, 0.5
 
+def _parse(games_filepath: str):
+    # Keep a list of players and interactions. Names are interned so every
+    # interaction shares the same string objects, and the outcome tuples
+    # are shared through the outcome table.
+    pairs, outcomes = [], []
+    for player, opponent, outcome in iter_items(games_filepath):
+        pairs.append([intern(player), intern(opponent)])
+        outcomes.append(chess_outcome(outcome, DRAW))
 
-def load_fixtures(dataset: str):
+    players = list(dict.fromkeys(chain.from_iterable(pairs)))
+    interactions = list(map(Interaction, pairs, outcomes))
+
+    return players, interactions
+
+
+def _parse_soa(games_filepath: str):
+    # Games are streamed into growable typed buffers, never holding more
+    # than a few bytes per game. They are 64 bits wide, the dtypes of
+    # InteractionBatch.from_interactions.
+    index: "dict[str, int]" = {}
+    player_idx, opponent_idx = array("q"), array("q")
+    outcomes = array("d")
+
+    for player, opponent, outcome in iter_items(games_filepath):
+        player_idx.append(index.setdefault(intern(player), len(index)))
+        opponent_idx.append(index.setdefault(intern(opponent), len(index)))
+        outcomes.extend(chess_outcome(outcome, DRAW))
+
+    players = list(index)
+    player_idx = np.frombuffer(player_idx, dtype=np.int64)
+    opponent_idx = np.frombuffer(opponent_idx, dtype=np.int64)
+
+    return players, InteractionBatch(
+        players,
+        player_idx.astype(np.intp, copy=False),
+        opponent_idx.astype(np.intp, copy=False),
+        np.frombuffer(outcomes, dtype=np.float64).reshape(-1, 2)
+    )
+
+
+def _games_filepath(dataset: str) -> str:
     if dataset == "long":
-        games_filepath = f"{dirname(__file__)}/computer_chess.500k.json"
+        return f"{dirname(__file__)}/computer_chess.500k.json"
     elif dataset == "short":
-        games_filepath = f"{dirname(__file__)}/shortened_games.json"
-    else:
-        raise ValueError()
-
-    with open(games_filepath, "r") as f:
-        games = json.load(f)
-
-    # Keep a list of players and interactions
-    players = set()
-    interactions = []
-    for game in games:
-        # Add players to the list if they aren't in already
-        player, opponent, outcome = game
-
-        players.update([player, opponent])
-        # Convert chess string format to
-        # win-loss outcome format and save it
-        interactions.append(
-            Interaction(
-                players=[player, opponent],
-                outcomes=str_to_outcome(outcome)
-            )
-        )
+        return f"{dirname(__file__)}/shortened_games.json"
+    raise ValueError()
 
-    return players, interactions
+
+def load_fixtures(dataset: str):
+    return load_cached(_parse, _games_filepath(dataset))
+
+
+def load_fixtures_soa(dataset: str):
+    """Same as load_fixtures, but returns the interactions as an
+    InteractionBatch. Iterating the batch yields Interaction objects."""
+    return load_cached(_parse_soa, _games_filepath(dataset))
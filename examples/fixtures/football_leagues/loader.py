@@ -1,32 +1,36 @@
-import json
-from os.path import dirname
+from os.path import dirname, exists
+from sys import intern
 
 from popcore import Interaction
 
+from .._cache import load_cached
+from .._io import load_json
+
+
+def _parse(interactions_file: str, clubs_file: str):
+    # Get a list of all club names
+    clubs = load_json(clubs_file)
+    players = [intern(team["name"]) for team in clubs["clubs"]]
+
+    # Get the list of all interactions between clubs
+    matches = load_json(interactions_file)["matches"]
+
+    pairs = [
+        [intern(match["team1"]), intern(match["team2"])] for match in matches]
+    outcomes = [match["score"]["ft"] for match in matches]
+    interactions: "list[Interaction]" = list(
+        map(Interaction, pairs, outcomes))
+
+    return players, interactions
+
 
 def load_fixtures(league: str = "en"):
     # Load test data
     d = dirname(__file__)
-    clubs_file: str = f"{d}/data/{league}.1.clubs.json"
-    with open(clubs_file, 'r', encoding='UTF-8') as f:
-        # Get a list of all club names
-        clubs = json.load(f)
-        players = [team["name"] for team in clubs["clubs"]]
-
     interactions_file: str = f"{d}/fixtures/{league}.1.json"
-    with open(interactions_file, 'r', encoding='UTF-8') as f:
-        # Get the list of all interactions between clubs
-        matches = json.load(f)
-        interactions: "list[Interaction]" = []
-
-        for match in matches["matches"]:
-            player, opponent = match["team1"], match["team2"]
-            outcomes: "list[int]" = match["score"]["ft"]
-            interactions.append(
-                Interaction(
-                    [player, opponent],
-                    outcomes
-                )
-            )
+    if not exists(interactions_file):
+        # The match files tracked in this repository sit next to the clubs
+        interactions_file = f"{d}/data/{league}.1.json"
+    clubs_file: str = f"{d}/data/{league}.1.clubs.json"
 
-    return players, interactions
+    return load_cached(_parse, interactions_file, clubs_file)
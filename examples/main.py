@@ -1,40 +1,62 @@
 import argparse
 import functools
+import importlib
+import multiprocessing as mp
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+
+import numpy as np
 
 from poprank import Rate
-from poprank.functional.rates import (
-    elo, bayeselo, glicko, glicko2, multidim_elo, nash_avg,
-    rectified_nash_avg, windrawlose, trueskill, winlose,
-)
-from poprank.functional.rates.experimental import (
-    laplacian
-)
 
 from fixtures.chess_engines.loader import load_fixtures as chess_engine_loader
 from fixtures.football_leagues.loader import load_fixtures as football_loader
 from fixtures.language_models.loader import load_fixture as llm_loader
 
 
+def _lazy(module: str, name: str, **kwargs):
+    """Returns a factory that imports the rating method `name` from `module`
+    on first use, binding `kwargs` to it. Only the backends actually run
+    get imported."""
+    def factory():
+        method = getattr(importlib.import_module(module), name)
+        return functools.partial(method, **kwargs) if kwargs else method
+    return factory
+
+
+_RATES = "poprank.functional.rates"
+
 RATINGS = {
-    "elo": elo,
-    "stream_elo": functools.partial(elo, reduce="stream"),
-    "bayeselo": bayeselo,
-    "glicko": glicko,
-    "glicko2": glicko2,
-    "trueskill": trueskill,
-    "multidim_elo": functools.partial(multidim_elo, iterations=5),
-    "nash_avg": nash_avg,
-    "rectified_nash_avg": rectified_nash_avg,
-    "windrawlose": functools.partial(
-        windrawlose, win_value=3.0, draw_value=1.0, loss_value=0.0
+    "elo": _lazy(_RATES, "elo"),
+    "stream_elo": _lazy(_RATES, "elo", reduce="stream"),
+    "bayeselo": _lazy(_RATES, "bayeselo"),
+    "glicko": _lazy(_RATES, "glicko"),
+    "glicko2": _lazy(_RATES, "glicko2"),
+    "trueskill": _lazy(_RATES, "trueskill"),
+    "multidim_elo": _lazy(_RATES, "multidim_elo", iterations=5),
+    "nash_avg": _lazy(_RATES, "nash_avg"),
+    "rectified_nash_avg": _lazy(_RATES, "rectified_nash_avg"),
+    "windrawlose": _lazy(
+        _RATES, "windrawlose", win_value=3.0, draw_value=1.0, loss_value=0.0
     ),
-    "winlose": functools.partial(
-        winlose, win_value=1.0, loss_value=-1.0
+    "winlose": _lazy(
+        _RATES, "winlose", win_value=1.0, loss_value=-1.0
     ),
-    "laplacian": laplacian
+    "laplacian": _lazy(f"{_RATES}.experimental", "laplacian")
 }
 
+# numba is optional
+if find_spec("numba") is not None:
+    RATINGS["numba_elo"] = _lazy("numba_elo", "numba_elo")
+    RATINGS["numba_bayeselo"] = _lazy("numba_bayeselo", "numba_bayeselo")
+    RATINGS["numba_bayeselo_jacobi"] = _lazy(
+        "numba_bayeselo", "numba_bayeselo", jacobi=True)
+
+# Methods that take the initial rates as a float array of means
+ARRAY_RATINGS = {"numba_elo", "numba_bayeselo", "numba_bayeselo_jacobi"}
+
 FIXTURES = {
     "language-models": llm_loader,
     "football-en": functools.partial(
@@ -63,32 +85,70 @@ def parse_args():
     return parser.parse_args()
 
 
+# Fixture shared with the worker processes, see _init_worker.
+_players, _interactions, _zero_rates = None, None, None
+
+
+def _init_worker(players, interactions, zero_rates):
+    global _players, _interactions, _zero_rates
+    _players, _interactions, _zero_rates = players, interactions, zero_rates
+
+
+def run_method(method: str):
+    """Rates the shared fixture with `method`, starting every player at 0.
+
+    :return: the method name, the resulting rates and the elapsed time.
+    """
+    if method in ARRAY_RATINGS:
+        rates = _zero_rates.copy()
+    else:
+        rates = [Rate(mu) for mu in _zero_rates.tolist()]
+    rating_method = RATINGS[method]()
+    t1 = time.time()
+    rates = rating_method(_players, _interactions, rates)
+    t2 = time.time()
+    return method, rates, t2 - t1
+
+
+def sort_by_mu(rates, *lists):
+    """Reorders `rates`, and every list in `lists` alongside it, by
+    decreasing mean. Ties keep their original order."""
+    order = np.argsort([-rate.mu for rate in rates], kind="stable")
+    return [[seq[i] for i in order] for seq in (rates, *lists)]
+
+
+def report(method, players, rates, elapsed):
+    rates, players = sort_by_mu(rates, players)
+
+    col1, col2 = "model", f"{method}"
+    print(f"{col1:>30} | {col2:>5}")
+    print("".ljust(50, "-"))
+    for e, p in zip(rates, players):
+        print(f"{p:>30} | {e.mu:>5}")
+    print("".ljust(50, "-"))
+    print(f"rate {method}, time: {elapsed} seconds")
+
+
 def main():
     args = parse_args()
 
-    # Initialize the elos to 0
     fixture_loader = FIXTURES[args.source]
     players, interactions = fixture_loader()
-    players = list(players)
-
-    methods = RATINGS.keys() if args.method == "all" else [args.method]
-
-    for method in methods:
-        rates = [Rate(0.0) for x in players]
-        rating_method = RATINGS[method]
-        t1 = time.time()
-        rates = rating_method(players, interactions, rates)
-        t2 = time.time()
-        rates, players = [list(t) for t in zip(
-                *sorted(zip(rates, players), key=lambda x: x[0].mu, reverse=True))]
-
-        col1, col2 = "model", f"{method}"
-        print(f"{col1:>30} | {col2:>5}")
-        print("".ljust(50, "-"))
-        for e, p in zip(rates, players):
-            print(f"{p:>30} | {e.mu:>5}")
-        print("".ljust(50, "-"))
-        print(f"rate {method}, time: {t2 - t1} seconds")
+
+    methods = list(RATINGS) if args.method == "all" else [args.method]
+    zero_rates = np.zeros(len(players), dtype=np.float64)
+
+    # The methods are independent, rate with each in its own process. On
+    # POSIX, forking lets the workers inherit the fixture without pickling.
+    context = mp.get_context("fork" if os.name == "posix" else "spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(len(methods), os.cpu_count() or 1),
+        mp_context=context, initializer=_init_worker,
+        initargs=(players, interactions, zero_rates)
+    ) as executor:
+        # Reported in the order of methods, whichever finishes first
+        for method, rates, elapsed in executor.map(run_method, methods):
+            report(method, players, rates, elapsed)
 
 
 if __name__ == "__main__":
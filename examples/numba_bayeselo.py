@@ -0,0 +1,138 @@
+import numpy as np
+from numba import njit, prange
+
+from poprank.functional.rates import bayeselo
+from poprank.functional.rates._bayeselo.core import (
+    _CONVERGENCE_CHECK_PERIOD, BayesEloRating
+)
+
+
+@njit(cache=True)
+def _mm_kernel(row_ptr, opp_idx, w_num, l_num, w_num_ji, l_num_ji, wins,
+               home_field_bias, draw_bias, iterations, tolerance,
+               check_period):
+    """The MM loop of BayesEloRating._minorize_maximize_ratings, on the
+    flat statistics. Same backward Gauss-Seidel sweep, same stopping rule:
+    convergence is checked every `check_period` sweeps, then every sweep
+    once within 10 times the tolerance."""
+    num_players = wins.size
+    ratings = np.ones(num_players)
+    next_ratings = np.zeros(num_players)
+    draw_home_bias = draw_bias * home_field_bias
+
+    diff = np.inf
+    for iteration in range(iterations):
+        for player in range(num_players - 1, -1, -1):
+            rating = ratings[player]
+            B = 0.0
+            for k in range(row_ptr[player + 1] - 1, row_ptr[player] - 1, -1):
+                opponent = opp_idx[k]
+                if opponent > player:
+                    opponent_rating = next_ratings[opponent]
+                else:
+                    opponent_rating = ratings[opponent]
+
+                B += (w_num[k] /
+                      (home_field_bias * rating +
+                       draw_bias * opponent_rating) +
+                      l_num[k] /
+                      (draw_home_bias * rating + opponent_rating) +
+                      w_num_ji[k] /
+                      (home_field_bias * opponent_rating +
+                       draw_bias * rating) +
+                      l_num_ji[k] /
+                      (draw_home_bias * opponent_rating + rating))
+            next_ratings[player] = wins[player] / B
+
+        ratings, next_ratings = next_ratings, ratings
+        if iteration % check_period == 0 or diff < 10 * tolerance:
+            diff = 0.0
+            for player in range(num_players):
+                change = abs(ratings[player] - next_ratings[player]) / \
+                    (ratings[player] + next_ratings[player])
+                if change > diff:
+                    diff = change
+            if diff < tolerance:
+                break
+
+    return ratings
+
+
+@njit(parallel=True, cache=True)
+def _mm_kernel_jacobi(row_ptr, opp_idx, w_num, l_num, w_num_ji, l_num_ji,
+                      wins, home_field_bias, draw_bias, iterations,
+                      tolerance, check_period):
+    """_mm_kernel with Jacobi sweeps, as BayesEloRating(jacobi=True) does.
+    Every player is updated from the previous ratings only, so the players
+    of a sweep are spread over threads."""
+    num_players = wins.size
+    ratings = np.ones(num_players)
+    next_ratings = np.zeros(num_players)
+    draw_home_bias = draw_bias * home_field_bias
+
+    diff = np.inf
+    for iteration in range(iterations):
+        for player in prange(num_players):
+            rating = ratings[player]
+            B = 0.0
+            for k in range(row_ptr[player], row_ptr[player + 1]):
+                opponent_rating = ratings[opp_idx[k]]
+                B += (w_num[k] /
+                      (home_field_bias * rating +
+                       draw_bias * opponent_rating) +
+                      l_num[k] /
+                      (draw_home_bias * rating + opponent_rating) +
+                      w_num_ji[k] /
+                      (home_field_bias * opponent_rating +
+                       draw_bias * rating) +
+                      l_num_ji[k] /
+                      (draw_home_bias * opponent_rating + rating))
+            next_ratings[player] = wins[player] / B
+
+        ratings, next_ratings = next_ratings, ratings
+        if iteration % check_period == 0 or diff < 10 * tolerance:
+            diff = np.max(np.abs(ratings - next_ratings) /
+                          (ratings + next_ratings))
+            if diff < tolerance:
+                break
+
+    return ratings
+
+
+class NumbaBayesEloRating(BayesEloRating):
+    """BayesEloRating whose fixed-bias MM loop runs in _mm_kernel, or in
+    _mm_kernel_jacobi with jacobi=True"""
+
+    def _minorize_maximize_ratings(
+        self, update_ratings, iterations: int, tolerance: float
+    ) -> None:
+        stats = self.pairwise_stats
+        kernel = _mm_kernel_jacobi if self.jacobi else _mm_kernel
+        self.ratings = kernel(
+            stats.row_ptr, stats.opp_idx, *self._weighted(),
+            np.asarray(self._wins),
+            self.home_field_bias, self.draw_bias, iterations, tolerance,
+            _CONVERGENCE_CHECK_PERIOD
+        )
+
+
+def numba_bayeselo(
+    players, interactions, elos, elo_base: float = 10.,
+    elo_spread: float = 400., elo_draw: float = 97.3,
+    elo_advantage: float = 32.8, iterations: int = 10000,
+    tolerance: float = 1e-5, jacobi: bool = False
+):
+    """bayeselo with the MM iterations compiled with numba. `elos` is
+    either a list of EloRate or a float array of initial means. With
+    `jacobi`, the sweeps run in parallel over the players.
+    """
+    if isinstance(elos, np.ndarray):
+        elos = elos.astype(np.float64).tolist()
+
+    return bayeselo(
+        players, interactions, elos, elo_base=elo_base,
+        elo_spread=elo_spread, elo_draw=elo_draw,
+        elo_advantage=elo_advantage, iterations=iterations,
+        tolerance=tolerance, jacobi=jacobi,
+        rating_class=NumbaBayesEloRating
+    )
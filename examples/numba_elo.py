@@ -0,0 +1,65 @@
+from math import log
+
+import numpy as np
+from numba import njit
+
+from poprank.functional.rates import EloRate, EloRateSequence
+from poprank.utils import InteractionBatch
+
+
+@njit(cache=True)
+def _elo_kernel(player_idx, opponent_idx, outcomes, rates, k_factor, q):
+    """Updates `rates` in place like elo(reduce="stream"): the player
+    first, then the opponent against the player's new rating. `q` is
+    ln(base) / spread."""
+    for t in range(player_idx.size):
+        i, j = player_idx[t], opponent_idx[t]
+        expected = 1.0 / (1.0 + np.exp(q * (rates[j] - rates[i])))
+        rates[i] += k_factor * (outcomes[t, 0] - expected)
+        expected = 1.0 / (1.0 + np.exp(q * (rates[i] - rates[j])))
+        rates[j] += k_factor * (outcomes[t, 1] - expected)
+
+
+def numba_elo(
+    players, interactions, elos, k_factor: float = 20.0,
+    base: float = 10., spread: float = 400.
+):
+    """Sequential (stream) Elo over pairwise interactions, compiled with
+    numba. `interactions` is either a list of Interaction or an
+    InteractionBatch indexed like `players`. `elos` is either a list of
+    EloRate, rated with their shared base and spread, or a float array of
+    initial means, rated with `base` and `spread`, which skips the
+    conversion.
+    """
+    if isinstance(interactions, InteractionBatch):
+        interactions.check_players(players)
+    else:
+        interactions = InteractionBatch.from_interactions(
+            players, interactions)
+
+    if isinstance(elos, np.ndarray):
+        rates = elos.astype(np.float64)
+        return [
+            EloRate(mu, base=base, spread=spread)
+            for mu in _rate(interactions, rates, k_factor, base, spread)
+        ]
+
+    # Raises ValueError if the elos do not share a base and spread
+    elos = EloRateSequence.from_rates(elos)
+    rates = elos.mus.copy()
+    return [
+        EloRate(mu, std, elos.base, elos.spread)
+        for mu, std in zip(
+            _rate(interactions, rates, k_factor, elos.base, elos.spread),
+            elos.stds.tolist())
+    ]
+
+
+def _rate(interactions: InteractionBatch, rates, k_factor: float,
+          base: float, spread: float):
+    _elo_kernel(
+        interactions.player_idx, interactions.opponent_idx,
+        interactions.outcomes.astype(np.float64), rates, float(k_factor),
+        log(base) / spread
+    )
+    return rates.tolist()
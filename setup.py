@@ -1,14 +0,0 @@
-from distutils.core import setup
-
-# setup()
-
-setup(
-    name='poprank',
-    version='0.1',
-    description='Rating Mechanisms',
-    author='Manfred Diaz, Aurelien Buck-Kaeffer',
-    author_email='',
-    url='https://www.python.org/sigs/distutils-sig/',
-    package_dir={'': 'src'},
-    packages=['poprank'],
-)
@@ -1,8 +1,8 @@
 from .core import (
-    Rate, Rank, RateModule, RankModule
+    Rate, Rank, RateModule, RankModule, RateSequence
 )
 
 __all__ = [
     "Rate", "Rank", "RateModule",
-    "RankModule"
+    "RankModule", "RateSequence"
 ]
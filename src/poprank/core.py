@@ -1,16 +1,25 @@
 # core
 from abc import ABC, abstractmethod
-from math import sqrt
-from statistics import NormalDist
+from collections.abc import Sequence
+from math import isfinite, sqrt
 from typing import Any, Generic, Iterable, List, TypeVar
 # third-party
 import numpy as np
+from scipy.special import ndtr
 # internal
 from popcore import (
     Interaction, Population,
 )
 
 
+def _isclose(a: float, b: float) -> bool:
+    """Scalar np.isclose with its default tolerances (rtol=1e-05,
+    atol=1e-08), without the array dispatch"""
+    if a == b:
+        return True
+    return isfinite(b) and abs(a - b) <= 1e-08 + 1e-05 * abs(b)
+
+
 class Rate:
     """
         Default Rate. It is the canonical representation of a gaussian, where
@@ -21,12 +30,16 @@ class Rate:
         :param float std: Standard deviation. Defaults to 1.
     """
 
-    __mu: float
-    __std: float
+    # Slots rather than an instance dict. Subclasses that do not override
+    # the mu/std properties can read and write _mu/_std directly.
+    __slots__ = ("_mu", "_std")
+
+    _mu: float
+    _std: float
 
     def __init__(self, mu: float = 0.0, std: float = 1.0):
-        self.__mu = mu
-        self.__std = std
+        self._mu = mu
+        self._std = std
 
     def sample(self) -> float:
         raise NotImplementedError()
@@ -40,9 +53,7 @@ class Rate:
             TODO: Maybe use a metric (KL, TV?) between Gaussians?
             TODO: If left untouched, verify tolerance.
         """
-        is_equal = np.isclose(self.mu, other.mu)
-        is_equal &= np.isclose(self.std, other.std)
-        return is_equal
+        return _isclose(self.mu, other.mu) and _isclose(self.std, other.std)
 
     def __repr__(self) -> str:
         return f"Rate(mu={self.mu}, std={self.std})"
@@ -52,22 +63,22 @@ class Rate:
         """
         Mean
         """
-        return self.__mu
+        return self._mu
 
     @mu.setter
     def mu(self, value) -> None:
-        self.__mu = value
+        self._mu = value
 
     @property
     def std(self) -> float:
         """
         Standard deviation
         """
-        return self.__std
+        return self._std
 
     @std.setter
     def std(self, value: float) -> None:
-        self.__std = value
+        self._std = value
 
     def predict(self, opponent: "Rate"):
         """Probability that the player rate is greater than the opponent's rate
@@ -77,14 +88,74 @@ class Rate:
         :return: The probability P(self>opponent).
         :rtype: float
         """
-        mean = self.mu - opponent.mu
-        standard_dev = sqrt(self.std ** 2 + opponent.std ** 2)
-        return 1.0 - NormalDist(mean, standard_dev).cdf(x=0)
+        std, opponent_std = self.std, opponent.std
+        standard_dev = sqrt(std * std + opponent_std * opponent_std)
+        return float(ndtr((self.mu - opponent.mu) / standard_dev))
+
+    def predict_batch(self, mus: np.ndarray, stds: np.ndarray) -> np.ndarray:
+        """Probability that the player rate is greater than each of the
+        opponents' rates, computed in a single vectorized call.
+
+        :param np.ndarray mus: Opponents' means
+        :param np.ndarray stds: Opponents' standard deviations
+        :return: The probabilities P(self>opponent_i).
+        :rtype: np.ndarray
+        """
+        stds = np.asarray(stds, dtype=float)
+        standard_dev = np.sqrt(self.std * self.std + stds * stds)
+        return ndtr((self.mu - np.asarray(mus, dtype=float)) / standard_dev)
+
+    @classmethod
+    def predict_matrix(cls, mus: np.ndarray, stds: np.ndarray) -> np.ndarray:
+        """Pairwise probabilities that each rate is greater than each other
+        rate, computed in a single vectorized call.
+
+        :param np.ndarray mus: Means of the n rates
+        :param np.ndarray stds: Standard deviations of the n rates
+        :return: An n by n matrix whose entry (i, j) is P(rate_i>rate_j).
+        :rtype: np.ndarray
+        """
+        mus = np.asarray(mus, dtype=float)
+        variances = np.square(np.asarray(stds, dtype=float))
+        standard_dev = np.sqrt(variances[:, None] + variances[None, :])
+        return ndtr((mus[:, None] - mus[None, :]) / standard_dev)
 
 
 RateType = TypeVar("RateType", bound=Rate)
 
 
+class RateSequence(Sequence):
+    """
+        Read-only sequence of rates stored as parallel arrays of means and
+        standard deviations. Rates are materialized on access.
+
+        :param np.ndarray mus: Means
+        :param np.ndarray stds: Standard deviations, same length as `mus`
+        :param np.dtype dtype: Floating point type of the arrays, float32
+            halves their size. Defaults to float64
+    """
+    def __init__(
+        self, mus: np.ndarray, stds: np.ndarray, dtype=np.float64
+    ) -> None:
+        if len(mus) != len(stds):
+            raise ValueError("Means and standard deviations length mismatch"
+                             f": {len(mus)} != {len(stds)}")
+        self.mus = np.asarray(mus, dtype=dtype)
+        self.stds = np.asarray(stds, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.mus)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RateSequence(
+                self.mus[index], self.stds[index], self.mus.dtype)
+        return Rate(float(self.mus[index]), float(self.stds[index]))
+
+    def __repr__(self) -> str:
+        return f"RateSequence(mus={self.mus!r}, stds={self.stds!r})"
+
+
 class RateModule(Generic[RateType], ABC):
     """
         A Rate Module contains a sequence of ratings.
@@ -139,16 +210,30 @@ class Rank:
          S_n the permutation group.
     """
     def __init__(self, idx: Iterable[int]) -> None:
-        self._idx = np.asarray(idx)  # TODO: test the rank is complete
+        # TODO: test the rank is complete
+        self._idx = np.asarray(idx, dtype=np.intp)
         self.n = len(self._idx)
 
-    def compose(self, other: 'Rank') -> 'Rank':
+    def compose(self, other: 'Rank', out: np.ndarray = None) -> 'Rank':
+        """
+            Composes this rank with `other`.
+
+        :param Rank other: The rank to compose with
+        :param np.ndarray out: Optional preallocated intp array of size n
+            the composition is written to. The returned rank wraps it
+            without a copy.
+        :return: The composed rank.
+        :rtype: Rank
+        """
         if self.n != other.n:
             raise ValueError()  # TODO: exception raising
-        return Rank(other._idx[self._idx])
+        return Rank(np.take(other._idx, self._idx, out=out))
 
     def inverse(self) -> 'Rank':
-        return Rank(np.argsort(self._idx))
+        # Scatter each position to its index, linear instead of an argsort
+        inverse = np.empty_like(self._idx)
+        inverse[self._idx] = np.arange(self.n, dtype=np.intp)
+        return Rank(inverse)
 
     def __iter__(self) -> Iterable[int]:
         return iter(self._idx)
@@ -184,7 +269,11 @@ class RankModule(Generic[RateType]):
         self._ranks: List[Rank] = []
 
     def _rank(self, rates: List[RateType], **kwds) -> Rank:
-        return Rank(np.argsort(rates))
+        # Sort the means natively rather than the Rate objects through
+        # Rate.__lt__, which compares the same means
+        mus = np.fromiter(
+            (rate.mu for rate in rates), dtype=np.float64, count=len(rates))
+        return Rank(np.argsort(mus))
 
     def __call__(self, rates: List[RateType], **kwds: Any) -> Any:
         rank = self._rank(rates, **kwds)
@@ -13,6 +13,9 @@ def sigmoid(x: float, base: float = math.e) -> float:
     :return: function value
     :rtype: float
     """
+    if base != math.e:
+        x *= math.log(base)
     if x >= 0.0:
-        return 1.0 / (1 + pow(base, -x))
-    return pow(base, x) / (1 + pow(base, x))
+        return 1.0 / (1 + math.exp(-x))
+    z = math.exp(x)
+    return z / (1 + z)
@@ -1,5 +1,5 @@
 # flake8: noqa
-from .elo import elo, EloRate
+from .elo import elo, elo_mu, EloRate, EloRateSequence
 from .bayeselo import bayeselo
 from .glicko import glicko, glicko2, GlickoRate, Glicko2Rate
 from .nashavg import nash_avg, rectified_nash_avg
@@ -9,8 +9,8 @@ from .melo import multidim_elo, MultidimEloRate
 
 
 __all__ = [
-    "elo", "bayeselo", "glicko", "glicko2", "multidim_elo", "nash_avg",
+    "elo", "elo_mu", "bayeselo", "glicko", "glicko2", "multidim_elo", "nash_avg",
     "rectified_nash_avg", "windrawlose", "trueskill", "winlose",
-    "EloRate", "GlickoRate", "Glicko2Rate", "TrueSkillRate",
-    "MultidimEloRate"
+    "EloRate", "EloRateSequence", "GlickoRate", "Glicko2Rate",
+    "TrueSkillRate", "MultidimEloRate"
 ]
@@ -1,7 +1,14 @@
 from math import log
+from typing import Callable, Optional
+import numpy as np
 
 from ..elo import EloRate
-from .data import BayesEloStats, PairwiseStatistics
+from .data import BayesEloStats
+
+
+# Iterations between two convergence checks of the MM loop, while far from
+# convergence
+_CONVERGENCE_CHECK_PERIOD = 8
 
 
 class BayesEloRating:
@@ -25,6 +32,11 @@ class BayesEloRating:
             formula. Defaults to 400.0.
         home_field_bias (float, optional): _description_. Defaults to 0.0.
         draw_bias (float, optional): _description_. Defaults to 0.0.
+        jacobi (bool, optional): Update all the ratings from the previous
+            sweep at once (Jacobi) as vectorized array operations, instead
+            of one player at a time from the latest ratings (Gauss-Seidel).
+            Each sweep is much cheaper, but more sweeps are needed.
+            Defaults to False.
 
     Methods:
         update_ratings(self) -> None: Performs one iteration of the
@@ -47,7 +59,7 @@ class BayesEloRating:
         self, pairwise_stats: BayesEloStats,
         elos: "list[EloRate]", elo_advantage: float = 32.8,
         elo_draw: float = 97.3, base=10., spread=400.,
-        home_field_bias=0.0, draw_bias=0.0
+        home_field_bias=0.0, draw_bias=0.0, jacobi: bool = False
     ):
 
         # Condensed results
@@ -55,103 +67,219 @@ class BayesEloRating:
         self.elos = elos  # Players elos
         self.elo_advantage = elo_advantage  # advantage of playing white
         self.elo_draw = elo_draw  # likelihood of drawing
-        self.ratings = [0. for x in range(pairwise_stats.num_players)]
-        self.next_ratings = [0. for x in range(pairwise_stats.num_players)]
+        # Two rating buffers, swapped after every MM sweep
+        self.ratings = [0.] * pairwise_stats.num_players
+        self.next_ratings = [0.] * pairwise_stats.num_players
         self.base = base
         self.spread = spread
+        # log(x, base) == log(x) * inv_log_base, without a second log call
+        self._inv_log_base: float = 1.0 / log(base)
         self.home_field_bias: float = home_field_bias
         self.draw_bias: float = draw_bias
+        if pairwise_stats.row_ptr is None:
+            pairwise_stats.flatten()
+        # Player of every pair of the flat statistics
+        self._players = np.repeat(
+            np.arange(pairwise_stats.num_players),
+            np.diff(pairwise_stats.row_ptr))
+        self._wins = self._player_wins(pairwise_stats)
+        self.jacobi = jacobi
+        # Numerators of the MM updates weighted by the biases, as arrays,
+        # and as rows of tuples for the Gauss-Seidel sweep. Both are
+        # recomputed only when the biases change
+        self._weighted_biases = None
+        self._numerators: "tuple[np.ndarray, ...]" = ()
+        self._numerator_rows: "Optional[list[list[tuple]]]" = None
+
+    @staticmethod
+    def _player_wins(pairwise_stats: BayesEloStats) -> "list[float]":
+        """The score w_ij + d_ij + l_ji + d_ji of every player, summed over
+        its pairs in the order of the reference implementation"""
+        stats = pairwise_stats
+        scores = (stats.w_ij + stats.d_ij + stats.l_ji + stats.d_ji).tolist()
+        row_ptr = stats.row_ptr.tolist()
+
+        wins: "list[float]" = []
+        for start, end in zip(row_ptr, row_ptr[1:]):
+            total: float = 0.0
+            for score in reversed(scores[start:end]):
+                total += score
+            wins.append(total)
+        return wins
+
+    def _weighted(self) -> "tuple[np.ndarray, ...]":
+        """The numerators of the MM updates weighted by the biases, for
+        every pair of the flat statistics: (d_ij + w_ij) * home_field_bias,
+        (d_ij + l_ij) * draw_bias * home_field_bias,
+        (d_ji + w_ji) * draw_bias and d_ji + l_ji. Recomputed only when
+        the biases change"""
+        biases = (self.home_field_bias, self.draw_bias)
+        if self._weighted_biases != biases:
+            home_field_bias, draw_bias = biases
+            stats = self.pairwise_stats
+            self._numerators = (
+                (stats.d_ij + stats.w_ij) * home_field_bias,
+                (stats.d_ij + stats.l_ij) * draw_bias * home_field_bias,
+                (stats.d_ji + stats.w_ji) * draw_bias,
+                stats.d_ji + stats.l_ji
+            )
+            self._numerator_rows = None
+            self._weighted_biases = biases
+        return self._numerators
+
+    def _weighted_rows(self) -> "list[list[tuple]]":
+        """The weighted numerators of every player as a list of
+        (opponent_idx, w_num, l_num, w_num_ji, l_num_ji) tuples. They are
+        plain lists, indexing arrays one float at a time would box every
+        value"""
+        numerators = self._weighted()
+        if self._numerator_rows is None:
+            stats = self.pairwise_stats
+            pairs = list(zip(
+                stats.opp_idx.tolist(),
+                *(numerator.tolist() for numerator in numerators)))
+            row_ptr = stats.row_ptr.tolist()
+            self._numerator_rows = [
+                pairs[start:end] for start, end in zip(row_ptr, row_ptr[1:])]
+        return self._numerator_rows
 
     def update_ratings(self) -> None:
-        """Performs one iteration of the Minorization-Maximization algorithm"""
+        """Performs one iteration of the Minorization-Maximization
+        algorithm, updating one player at a time from the latest ratings
+        (Gauss-Seidel)"""
+        # Locals instead of attribute lookups in the inner loop
+        pairs = self._weighted_rows()
+        wins = self._wins
+        ratings = self.ratings
+        next_ratings = self.next_ratings
+        home_field_bias = self.home_field_bias
+        draw_bias = self.draw_bias
+        draw_home_bias = draw_bias * home_field_bias
+
+        # Backwards, like the reference implementation: the sweep order
+        # decides which opponents are already updated, and so the results
         for player in range(self.pairwise_stats.num_players-1, -1, -1):
-            A: float = 0.0
             B: float = 0.0
-
-            for opponent in range(
-              self.pairwise_stats.num_opponents_per_player[player]-1, -1, -1):
-                result: PairwiseStatistics = \
-                    self.pairwise_stats.statistics[player][opponent]
-
-                if result.opponent_idx > player:
-                    opponent_rating = self.next_ratings[result.opponent_idx]
+            rating = ratings[player]
+            # Terms of the denominators that only depend on the player
+            home_rating = home_field_bias * rating
+            draw_rating = draw_bias * rating
+            draw_home_rating = draw_home_bias * rating
+
+            for opponent_idx, w_num, l_num, w_num_ji, l_num_ji in reversed(
+                    pairs[player]):
+                if opponent_idx > player:
+                    opponent_rating = next_ratings[opponent_idx]
                 else:
-                    opponent_rating = self.ratings[result.opponent_idx]
-
-                A += result.w_ij + result.d_ij + result.l_ji + result.d_ji
-
-                B += ((result.d_ij + result.w_ij) * self.home_field_bias /
-                      (self.home_field_bias * self.ratings[player] +
-                      self.draw_bias * opponent_rating) +
-                      (result.d_ij + result.l_ij) * self.draw_bias *
-                      self.home_field_bias /
-                      (self.draw_bias * self.home_field_bias *
-                       self.ratings[player] +
-                      opponent_rating) +
-                      (result.d_ji + result.w_ji) * self.draw_bias /
-                      (self.home_field_bias * opponent_rating +
-                      self.draw_bias * self.ratings[player]) +
-                      (result.d_ji + result.l_ji) /
-                      (self.draw_bias * self.home_field_bias *
-                       opponent_rating +
-                      self.ratings[player]))
-
-            self.next_ratings[player] = A / B
-
-        self.ratings, self.next_ratings = self.next_ratings, self.ratings
+                    opponent_rating = ratings[opponent_idx]
+
+                B += (w_num /
+                      (home_rating + draw_bias * opponent_rating) +
+                      l_num /
+                      (draw_home_rating + opponent_rating) +
+                      w_num_ji /
+                      (home_field_bias * opponent_rating + draw_rating) +
+                      l_num_ji /
+                      (draw_home_bias * opponent_rating + rating))
+
+            next_ratings[player] = wins[player] / B
+
+        self.ratings, self.next_ratings = next_ratings, ratings
+
+    def _update_ratings_jacobi(self) -> None:
+        """Performs one iteration of the Minorization-Maximization
+        algorithm, updating every player from the previous ratings, all at
+        once (Jacobi)"""
+        w_num, l_num, w_num_ji, l_num_ji = self._weighted()
+        players = self._players
+        home_field_bias = self.home_field_bias
+        draw_bias = self.draw_bias
+        draw_home_bias = draw_bias * home_field_bias
+
+        ratings = np.asarray(self.ratings, dtype=np.float64)
+        rating = ratings[players]
+        opponent_rating = ratings[self.pairwise_stats.opp_idx]
+
+        terms = (w_num /
+                 (home_field_bias * rating + draw_bias * opponent_rating) +
+                 l_num /
+                 (draw_home_bias * rating + opponent_rating) +
+                 w_num_ji /
+                 (home_field_bias * opponent_rating + draw_bias * rating) +
+                 l_num_ji /
+                 (draw_home_bias * opponent_rating + rating))
+        B = np.bincount(players, terms, len(ratings))
+
+        self.ratings, self.next_ratings = np.asarray(self._wins) / B, ratings
 
     def update_home_field_bias(self) -> float:
         """Use interaction statistics to update the home_field_bias
         automatically"""
-        numerator: float = 0.
-        denominator: float = 0.
-
-        for player in range(self.pairwise_stats.num_players-1, -1, -1):
-            for opponent in range(
-              self.pairwise_stats.num_opponents_per_player[player]-1, -1, -1):
-                result = self.pairwise_stats.statistics[player][opponent]
-                opponent_rating = self.ratings[result.opponent_idx]
-
-                numerator += result.w_ij + result.d_ij
-                denominator += ((result.d_ij + result.w_ij) *
-                                self.ratings[player] /
-                                (self.home_field_bias * self.ratings[player] +
-                                self.draw_bias * opponent_rating) +
-                                (result.d_ij + result.l_ij) * self.draw_bias *
-                                self.ratings[player] /
-                                (self.draw_bias * self.home_field_bias *
-                                self.ratings[player] + opponent_rating))
-
-        return numerator / denominator
+        stats = self.pairwise_stats
+        ratings = np.asarray(self.ratings, dtype=np.float64)
+        rating = ratings[self._players]
+        opponent_rating = ratings[stats.opp_idx]
+        home_field_bias = self.home_field_bias
+        draw_bias = self.draw_bias
+        draw_home_bias = draw_bias * home_field_bias
+        dw_ij = stats.d_ij + stats.w_ij
+        dl_ij = stats.d_ij + stats.l_ij
+
+        numerator = dw_ij.sum()
+        denominator = (dw_ij * rating /
+                       (home_field_bias * rating +
+                        draw_bias * opponent_rating) +
+                       dl_ij * draw_bias * rating /
+                       (draw_home_bias * rating + opponent_rating)).sum()
+
+        return float(numerator / denominator)
 
     def update_draw_bias(self) -> float:
         """Use interaction statistics to update the draw_bias automatically"""
-        numerator: float = 0.
-        denominator: float = 0.
-
-        for player in range(self.pairwise_stats.num_players-1, -1, -1):
-            for opponent in range(
-              self.pairwise_stats.num_opponents_per_player[player]-1, -1, -1):
-                result = self.pairwise_stats.statistics[player][opponent]
-                opponent_rating = self.ratings[result.opponent_idx]
-
-                numerator += result.d_ij
-                denominator += ((result.d_ij + result.w_ij) * opponent_rating /
-                                (self.home_field_bias * self.ratings[player] +
-                                self.draw_bias * opponent_rating) +
-                                (result.d_ij + result.l_ij) *
-                                self.home_field_bias *
-                                self.ratings[player] /
-                                (self.draw_bias * self.home_field_bias *
-                                self.ratings[player] + opponent_rating))
-
-        c: float = numerator / denominator
+        stats = self.pairwise_stats
+        ratings = np.asarray(self.ratings, dtype=np.float64)
+        rating = ratings[self._players]
+        opponent_rating = ratings[stats.opp_idx]
+        home_field_bias = self.home_field_bias
+        draw_bias = self.draw_bias
+        draw_home_bias = draw_bias * home_field_bias
+
+        numerator = stats.d_ij.sum()
+        denominator = ((stats.d_ij + stats.w_ij) * opponent_rating /
+                       (home_field_bias * rating +
+                        draw_bias * opponent_rating) +
+                       (stats.d_ij + stats.l_ij) * home_field_bias * rating /
+                       (draw_home_bias * rating + opponent_rating)).sum()
+
+        c: float = float(numerator / denominator)
         return c + (c * c + 1)**0.5
 
     def compute_difference(self, ratings: "list[float]",
                            next_ratings: "list[float]") -> float:
         """Compute the impact of the current interation on ratings"""
-        return max([abs(a-b)/(a+b) for a, b in zip(ratings, next_ratings)])
+        # One vectorized reduction instead of a list of N floats
+        ratings = np.asarray(ratings)
+        next_ratings = np.asarray(next_ratings)
+        return float(np.max(
+            np.abs(ratings - next_ratings) / (ratings + next_ratings)))
+
+    def _minorize_maximize_ratings(
+        self, update_ratings: "Callable[[], None]", iterations: int,
+        tolerance: float
+    ) -> None:
+        """The MM loop with fixed home field and draw biases, which only
+        updates the ratings with the sweep `update_ratings`. Convergence is
+        checked every _CONVERGENCE_CHECK_PERIOD iterations, then every
+        iteration once the difference gets within 10 times the tolerance."""
+        compute_difference = self.compute_difference
+        diff = float("inf")
+        for iteration in range(iterations):
+            update_ratings()
+            if iteration % _CONVERGENCE_CHECK_PERIOD == 0 or \
+                    diff < 10 * tolerance:
+                diff = compute_difference(self.ratings, self.next_ratings)
+                if diff < tolerance:
+                    break
 
     def minorize_maximize(
         self,
@@ -180,59 +308,72 @@ class BayesEloRating:
         # Set initial values
         self.home_field_bias = home_field_bias
         self.draw_bias = draw_bias
-        self.ratings = [1. for p in range(self.pairwise_stats.num_players)]
-
-        # Main MM loop
-        for player in range(iterations):
-            self.update_ratings()
-            diff = self.compute_difference(self.ratings, self.next_ratings)
-
-            if learn_home_field_bias:
-                new_home_field_bias = self.update_home_field_bias()
-                home_field_bias_diff = \
-                    abs(self.home_field_bias - new_home_field_bias)
-                if home_field_bias_diff > diff:
-                    diff = home_field_bias_diff
-                self.home_field_bias = new_home_field_bias
-
-            if learn_draw_bias:
-                new_draw_bias = self.update_draw_bias()
-                draw_bias_diff = abs(self.draw_bias - new_draw_bias)
-                if draw_bias_diff > diff:
-                    diff = draw_bias_diff
-                self.draw_bias = new_draw_bias
-
-            if diff < tolerance:
-                break
-
-        # Convert back to Elos
-        total: float = \
-            sum([log(self.ratings[player], self.base) * self.spread
-                 for player in range(self.pairwise_stats.num_players)])
+        self.ratings = [1.] * self.pairwise_stats.num_players
+        # The sweep is chosen once for the whole loop
+        update_ratings = self._update_ratings_jacobi if self.jacobi \
+            else self.update_ratings
+
+        if not learn_home_field_bias and not learn_draw_bias:
+            # The biases stay fixed, branch once instead of every iteration
+            self._minorize_maximize_ratings(
+                update_ratings, iterations, tolerance)
+        else:
+            # Main MM loop
+            for player in range(iterations):
+                update_ratings()
+                diff = self.compute_difference(self.ratings, self.next_ratings)
+
+                if learn_home_field_bias:
+                    new_home_field_bias = self.update_home_field_bias()
+                    home_field_bias_diff = \
+                        abs(self.home_field_bias - new_home_field_bias)
+                    if home_field_bias_diff > diff:
+                        diff = home_field_bias_diff
+                    self.home_field_bias = new_home_field_bias
+
+                if learn_draw_bias:
+                    new_draw_bias = self.update_draw_bias()
+                    draw_bias_diff = abs(self.draw_bias - new_draw_bias)
+                    if draw_bias_diff > diff:
+                        diff = draw_bias_diff
+                    self.draw_bias = new_draw_bias
+
+                if diff < tolerance:
+                    break
+
+        # Convert back to Elos, taking the log of every rating once
+        inv_log_base = self._inv_log_base
+        scaled: "list[float]" = [
+            log(rating) * inv_log_base * self.spread
+            for rating in np.asarray(self.ratings).tolist()]
+        total: float = sum(scaled)
 
         offset: float = -total / self.pairwise_stats.num_players
 
-        for player in range(self.pairwise_stats.num_players-1, -1, -1):
-            self.elos[player].mu = log(
-                self.ratings[player], self.base) * self.spread + offset
+        # New ratings, the initial ones may be the caller's
+        self.elos = [
+            EloRate(mu + offset, elo.std, elo.base, elo.spread)
+            for elo, mu in zip(self.elos, scaled)]
 
         if learn_home_field_bias:
             self.elo_advantage = \
-                log(self.home_field_bias, self.base) * self.spread
+                log(self.home_field_bias) * inv_log_base * self.spread
         if learn_draw_bias:
-            self.elo_draw = log(self.draw_bias, self.base) * self.spread
+            self.elo_draw = \
+                log(self.draw_bias) * inv_log_base * self.spread
 
     def rescale_elos(self) -> None:
-        """Rescales the elos by a common factor"""
-        # EloScale
-        for i, e in enumerate(self.elos):
-            x: float = e.base**(-self.elo_draw/e.spread)
-            elo_scale: float = x * 4.0 / ((1 + x) ** 2)
-            tmp_base: float = self.elos[i].base
-            tmp_spread: float = self.elos[i].spread
-            self.elos[i] = EloRate(
-                self.elos[i].mu * elo_scale,
-                self.elos[i].std
-            )
-            self.elos[i].base = tmp_base
-            self.elos[i].spread = tmp_spread
+        """Rescales the elos by a common factor, into a new list of new
+        EloRates"""
+        # EloScale, computed once per distinct base and spread (usually a
+        # single one for the whole population)
+        elo_scales: "dict[tuple[float, float], float]" = {}
+        elos: "list[EloRate]" = []
+        for e in self.elos:
+            elo_scale = elo_scales.get((e.base, e.spread))
+            if elo_scale is None:
+                x: float = e.base**(-self.elo_draw/e.spread)
+                elo_scale = x * 4.0 / ((1 + x) ** 2)
+                elo_scales[e.base, e.spread] = elo_scale
+            elos.append(EloRate(e.mu * elo_scale, e.std, e.base, e.spread))
+        self.elos = elos
@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from typing import Optional
+import numpy as np
 from popcore import Interaction
 
 
@@ -46,6 +48,13 @@ class BayesEloStats:  # crs
             each player
         statistics (list[list[PairwiseStatistics]]): Results for each
             pair of players
+        opponent_slots (list[dict[int, int]], optional): Position of each
+            opponent in the statistics of each player. Built from
+            statistics when not given. Defaults to None.
+        row_ptr, opp_idx, total_games, w_ij, d_ij, l_ij, w_ji, d_ji, l_ji
+            (np.ndarray, optional): The statistics as flat arrays with one
+            entry per pair, set by flatten(). The pairs of player i are at
+            row_ptr[i]:row_ptr[i+1]. Defaults to None.
 
     Static Methods:
         from_interactions(
@@ -60,26 +69,48 @@ class BayesEloStats:  # crs
          add_opponent(
             player: str,
             opponent: str,
-            ppcr_ids: "list[int]",
             indx: "dict[str, int]"
         ) -> None: Add an opponent to the player
 
         def add_prior(draw_prior: float = 2.0) -> None:
             Add prior draws to pairwise statistics
+
+        def flatten() -> None: Store the statistics as flat arrays
     """
     num_players: int  # Number of players in the pop
     num_opponents_per_player: "list[int]"  # nbr of opponents for each player
     statistics: "list[list[PairwiseStatistics]]"  # Results for each match
+    # Position of each opponent in statistics, per player
+    opponent_slots: "Optional[list[dict[int, int]]]" = None
+
+    # Struct-of-arrays copy of statistics, grouped by player
+    row_ptr: Optional[np.ndarray] = None  # Start of each player's pairs
+    opp_idx: Optional[np.ndarray] = None  # Opponent of each pair
+    total_games: Optional[np.ndarray] = None
+    w_ij: Optional[np.ndarray] = None
+    d_ij: Optional[np.ndarray] = None
+    l_ij: Optional[np.ndarray] = None
+    w_ji: Optional[np.ndarray] = None
+    d_ji: Optional[np.ndarray] = None
+    l_ji: Optional[np.ndarray] = None
+
+    def __post_init__(self) -> None:
+        if self.opponent_slots is None:
+            self.opponent_slots = [
+                {result.opponent_idx: slot
+                 for slot, result in enumerate(results)}
+                for results in self.statistics
+            ]
 
     def add_opponent(
         self,
         player: str,
         opponent: str,
-        ppcr_ids: "list[int]",
         indx: "dict[str, int]"
     ) -> None:
         """Add an opponent to the player"""
-        ppcr_ids[indx[player]].append(opponent)
+        self.opponent_slots[indx[player]][indx[opponent]] = \
+            self.num_opponents_per_player[indx[player]]
         self.statistics[indx[player]].append(PairwiseStatistics(
             player_idx=indx[player],
             opponent_idx=indx[opponent]
@@ -102,6 +133,30 @@ class BayesEloStats:  # crs
                 cr_opponent.d_ij += this_prior
                 cr_opponent.d_ji += this_prior
 
+    def flatten(self) -> None:
+        """Store the pairwise statistics as contiguous arrays, one per
+        field, with the pairs of player i at row_ptr[i]:row_ptr[i+1]"""
+        pairs = [result for results in self.statistics for result in results]
+
+        self.row_ptr = np.zeros(self.num_players + 1, dtype=np.intp)
+        np.cumsum(self.num_opponents_per_player, out=self.row_ptr[1:])
+        self.opp_idx = np.fromiter(
+            (result.opponent_idx for result in pairs), np.intp, len(pairs))
+        self.total_games = np.fromiter(
+            (result.total_games for result in pairs), np.intp, len(pairs))
+        self.w_ij = np.fromiter(
+            (result.w_ij for result in pairs), np.float64, len(pairs))
+        self.d_ij = np.fromiter(
+            (result.d_ij for result in pairs), np.float64, len(pairs))
+        self.l_ij = np.fromiter(
+            (result.l_ij for result in pairs), np.float64, len(pairs))
+        self.w_ji = np.fromiter(
+            (result.w_ji for result in pairs), np.float64, len(pairs))
+        self.d_ji = np.fromiter(
+            (result.d_ji for result in pairs), np.float64, len(pairs))
+        self.l_ji = np.fromiter(
+            (result.l_ji for result in pairs), np.float64, len(pairs))
+
     def find_opponent(
         self,
         player_idx: int,
@@ -117,9 +172,9 @@ class BayesEloStats:  # crs
         Raises:
             RuntimeError: If the opponent could not be foud
         """
-        for x in range(self.num_opponents_per_player[player_idx]):
-            if self.statistics[player_idx][x].opponent_idx == opponent_idx:
-                return self.statistics[player_idx][x]
+        slot = self.opponent_slots[player_idx].get(opponent_idx)
+        if slot is not None:
+            return self.statistics[player_idx][slot]
         raise RuntimeError(f"Cound not find opponent {opponent_idx} \
                         for player {player_idx}")
 
@@ -160,45 +215,83 @@ class BayesEloStats:  # crs
         # have fun figuring out this indexing mess :)
         num_opponents_per_player: "list[int]" = [0 for p in players]
         statistics: "list[list[PairwiseStatistics]]" = [[] for p in players]
-        ppcr_ids: "list[list[str]]" = [[] for p in players]
         indx: "dict[str, int]" = {p: i for i, p in enumerate(players)}
 
         pps: BayesEloStats = BayesEloStats(
             num_players=len(players),
             num_opponents_per_player=num_opponents_per_player,
-            statistics=statistics
+            statistics=statistics,
+            opponent_slots=[{} for p in players]
         )
 
-        for i in interactions:
-
-            # If the players have never played together before
-            if i.players[1] not in ppcr_ids[indx[i.players[0]]]:
-                # Add player 1 to the list of opponents of player 0
-                pps.add_opponent(i.players[0], i.players[1], ppcr_ids, indx)
-
-                # Add player 0 to the list of opponents of player 1
-                pps.add_opponent(i.players[1], i.players[0], ppcr_ids, indx)
-
-            p1_relative_id = ppcr_ids[indx[i.players[0]]].index(i.players[1])
-            p0_relative_id = ppcr_ids[indx[i.players[1]]].index(i.players[0])
-
-            if i.outcomes[0] > i.outcomes[1]:  # White wins
-                pps.statistics[indx[i.players[0]]][p1_relative_id].w_ij += 1
-                pps.statistics[indx[i.players[1]]][p0_relative_id].w_ji += 1
-
-            elif i.outcomes[0] < i.outcomes[1]:  # Black wins
-                pps.statistics[indx[i.players[0]]][p1_relative_id].l_ij += 1
-                pps.statistics[indx[i.players[1]]][p0_relative_id].l_ji += 1
-
-            else:  # Draw
-                pps.statistics[indx[i.players[0]]][p1_relative_id].d_ij += 1
-                pps.statistics[indx[i.players[1]]][p0_relative_id].d_ji += 1
-
-            # Update total games
-            pps.statistics[indx[i.players[0]]][p1_relative_id].total_games += 1
-            pps.statistics[indx[i.players[1]]][p0_relative_id].total_games += 1
+        num_players = len(players)
+        player = np.fromiter(
+            (indx[i.players[0]] for i in interactions), np.intp,
+            len(interactions))
+        opponent = np.fromiter(
+            (indx[i.players[1]] for i in interactions), np.intp,
+            len(interactions))
+        outcomes = np.array(
+            [i.outcomes for i in interactions], dtype=np.float64
+        ).reshape(-1, 2)
+
+        # Add the pairs of players in the order they first played together
+        pair_codes = np.minimum(player, opponent) * num_players + \
+            np.maximum(player, opponent)
+        _, first_games = np.unique(pair_codes, return_index=True)
+        for game in np.sort(first_games).tolist():
+            # Add each player to the list of opponents of the other
+            p0, p1 = interactions[game].players[:2]
+            pps.add_opponent(p0, p1, indx)
+            pps.add_opponent(p1, p0, indx)
+
+        # Position of the statistics of both sides of every game in the
+        # flattened statistics
+        row_ptr = np.zeros(num_players + 1, dtype=np.intp)
+        np.cumsum(num_opponents_per_player, out=row_ptr[1:])
+        slot_codes = np.fromiter(
+            (result.player_idx * num_players + result.opponent_idx
+             for results in statistics for result in results),
+            np.intp, row_ptr[-1])
+        order = np.argsort(slot_codes, kind="stable")
+        sorted_codes = slot_codes[order]
+        forward = order[np.searchsorted(
+            sorted_codes, player * num_players + opponent)]
+        backward = order[np.searchsorted(
+            sorted_codes, opponent * num_players + player)]
+
+        # Count the wins, draws and losses of every pair at once
+        wins = outcomes[:, 0] > outcomes[:, 1]  # White wins
+        losses = outcomes[:, 0] < outcomes[:, 1]  # Black wins
+        draws = ~(wins | losses)
+        num_slots = len(slot_codes)
+        counts = {
+            "w_ij": np.bincount(forward[wins], minlength=num_slots),
+            "w_ji": np.bincount(backward[wins], minlength=num_slots),
+            "l_ij": np.bincount(forward[losses], minlength=num_slots),
+            "l_ji": np.bincount(backward[losses], minlength=num_slots),
+            "d_ij": np.bincount(forward[draws], minlength=num_slots),
+            "d_ji": np.bincount(backward[draws], minlength=num_slots),
+            "total_games": np.bincount(forward, minlength=num_slots) +
+            np.bincount(backward, minlength=num_slots),
+        }
+        counts = {name: count.tolist() for name, count in counts.items()}
+
+        slot = 0
+        for results in statistics:
+            for result in results:
+                result.w_ij = counts["w_ij"][slot]
+                result.d_ij = counts["d_ij"][slot]
+                result.l_ij = counts["l_ij"][slot]
+                result.w_ji = counts["w_ji"][slot]
+                result.d_ji = counts["d_ji"][slot]
+                result.l_ji = counts["l_ji"][slot]
+                result.total_games = counts["total_games"][slot]
+                slot += 1
 
         if add_draw_prior:
             pps.add_prior(draw_prior)
 
+        pps.flatten()
+
         return pps
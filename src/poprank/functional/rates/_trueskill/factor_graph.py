@@ -57,14 +57,24 @@ THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."""
 
 from dataclasses import dataclass
-from math import sqrt
-from statistics import NormalDist
+from math import erfc, exp, pi, sqrt
 from typing import Callable
 from poprank import Rate
 from typing import List
 
 INF: float = float("inf")
-_norm: NormalDist = NormalDist()
+_INV_SQRT_2: float = 1. / sqrt(2.)
+_INV_SQRT_2PI: float = 1. / sqrt(2. * pi)
+
+
+def _cdf(x: float) -> float:
+    """Standard normal cumulative distribution function"""
+    return 0.5 * erfc(-x * _INV_SQRT_2)
+
+
+def _pdf(x: float) -> float:
+    """Standard normal probability density function"""
+    return _INV_SQRT_2PI * exp(-0.5 * x * x)
 
 
 @dataclass
@@ -74,116 +84,131 @@ class Gaussian(Rate):
     Attributes:
         pi (float): Precision, the inverse of the variance
         tau (float): Precision adjusted mean: precision times mean"""
-    __pi: float
-    __tau: float
+    __slots__ = ("_pi", "_tau")
+
+    _pi: float
+    _tau: float
 
     def __init__(self, mu: float = None, std: float = None,
                  pi: float = 0., tau: float = 0.):
         if mu is not None:  # Note: sigma should be nonzero
             pi = std ** -2
             tau = pi * mu
-        self.__pi = pi
-        self.__tau = tau
+        self._pi = pi
+        self._tau = tau
 
     @property
     def pi(self) -> float:
-        return self.__pi
+        return self._pi
 
     @pi.setter
     def pi(self, value) -> None:
-        self.__pi = value
+        self._pi = value
 
     @property
     def tau(self) -> float:
-        return self.__tau
+        return self._tau
 
     @tau.setter
     def tau(self, value) -> None:
-        self.__tau = value
+        self._tau = value
 
     @property
     def mu(self) -> float:
         """A property which returns the mean."""
-        return self.pi and self.tau / self.pi
+        return self._pi and self._tau / self._pi
 
     @mu.setter
     def mu(self, value) -> None:
-        self.__tau = self.__pi * value
+        self._tau = self._pi * value
 
     @property
     def std(self) -> float:
-        return sqrt(1. / self.__pi)
+        return sqrt(1. / self._pi)
 
     @std.setter
     def std(self, value) -> None:
-        self.__tau /= self.__pi
-        self.__pi = 1. / value ** 2
-        self.__tau *= self.__pi
+        self._tau /= self._pi
+        self._pi = 1. / value ** 2
+        self._tau *= self._pi
 
     def __mul__(self, other: "Gaussian") -> "Gaussian":
         """Multiplication between two Gaussians"""
-        pi, tau = self.pi + other.pi, self.tau + other.tau
-        return Gaussian(pi=pi, tau=tau)
+        return Gaussian(pi=self._pi + other._pi,
+                        tau=self._tau + other._tau)
 
     def __truediv__(self, other: "Gaussian") -> "Gaussian":
         """Division between two Gaussians"""
-        pi, tau = self.pi - other.pi, self.tau - other.tau
-        return Gaussian(pi=pi, tau=tau)
+        return Gaussian(pi=self._pi - other._pi,
+                        tau=self._tau - other._tau)
 
 
 class Variable(Gaussian):
-    """A variable in the factor graph. Inherits from Gaussian.
-
-    Attributes:
-        messages (dict["Factor", Gaussian]): This variable's messages
+    """A variable in the factor graph. Inherits from Gaussian. The messages
+    it receives are stored on the factors that send them.
 
     Methods:
         set(self, value: Gaussian) -> float: _description_
         delta(self, other: Gaussian) -> float: _description_
-        update_message(self, factor: "Factor", pi: float = 0.,
-                        tau: float = 0) -> float: _description_
-        update_value(self, factor: "Factor", pi: float = 0,
-                        tau: float = 0, value: Gaussian = None) -> float:
-            _description_
     """
 
-    def __init__(self) -> None:
-        self.messages: dict["Factor", Gaussian] = {}
-        super(Variable, self).__init__()
-
     def set(self, value: Gaussian) -> float:
-        delta: float = self.delta(value)
-        self.pi, self.tau = value.pi, value.tau
+        return self._set(value.pi, value.tau)
+
+    def _set(self, pi: float, tau: float) -> float:
+        """Sets the precision and precision adjusted mean, returning how
+        much they changed"""
+        delta: float = self._delta(pi, tau)
+        self._pi, self._tau = pi, tau
         return delta
 
     def delta(self, other: Gaussian) -> float:
-        pi_delta: float = abs(self.pi - other.pi)
+        return self._delta(other.pi, other.tau)
+
+    def _delta(self, pi: float, tau: float) -> float:
+        pi_delta: float = abs(self._pi - pi)
         if pi_delta == INF:
             return 0.
-        return max(abs(self.tau - other.tau), sqrt(pi_delta))
-
-    def update_message(self, factor: "Factor", pi: float = 0.,
-                       tau: float = 0) -> float:
-        message: Gaussian = Gaussian(pi=pi, tau=tau)
-        old_message: Gaussian = self.messages[factor]
-        self.messages[factor] = message
-        return self.set(self / old_message * message)
-
-    def update_value(self, factor: "Factor", pi: float = 0,
-                     tau: float = 0, value: Gaussian = None) -> float:
-        value = value or Gaussian(pi=pi, tau=tau)
-        old_message: Gaussian = self.messages[factor]
-        self.messages[factor] = value * old_message / self
-        return self.set(value)
+        tau_delta: float = abs(self._tau - tau)
+        pi_delta = sqrt(pi_delta)
+        return pi_delta if pi_delta > tau_delta else tau_delta
 
 
 class Factor():
-    """A factor in the factor graph"""
+    """A factor in the factor graph
+
+    Attributes:
+        variables (list[Variable]): The variables connected to this factor
+        pi_msgs (list[float]): Precision of the message sent to each
+            variable, indexed like `variables`
+        tau_msgs (list[float]): Precision adjusted mean of the message sent
+            to each variable, indexed like `variables`"""
 
     def __init__(self, variables: List[Variable]) -> None:
         self.variables: List[Variable] = variables
-        for variable in variables:
-            variable.messages[self] = Gaussian()
+        self.pi_msgs: List[float] = [0.] * len(variables)
+        self.tau_msgs: List[float] = [0.] * len(variables)
+
+    def update_message(self, index: int, pi: float = 0.,
+                       tau: float = 0.) -> float:
+        """Replaces the message sent to `variables[index]`, updating the
+        variable accordingly"""
+        variable: Variable = self.variables[index]
+        old_pi: float = self.pi_msgs[index]
+        old_tau: float = self.tau_msgs[index]
+        self.pi_msgs[index] = pi
+        self.tau_msgs[index] = tau
+        return variable._set(variable._pi - old_pi + pi,
+                             variable._tau - old_tau + tau)
+
+    def update_value(self, index: int, pi: float = 0.,
+                     tau: float = 0.) -> float:
+        """Sets `variables[index]` to the given value, updating the message
+        sent to it accordingly"""
+        variable: Variable = self.variables[index]
+        self.pi_msgs[index] = pi + self.pi_msgs[index] - variable._pi
+        self.tau_msgs[index] = tau + self.tau_msgs[index] - variable._tau
+        return variable._set(pi, tau)
 
     def pass_message_down(self) -> float:
         return 0.
@@ -203,12 +228,13 @@ class PriorFactor(Factor):
         super(PriorFactor, self).__init__([variable])
         self.rating: Rate = rating
         self.dynamic_variance: float = dynamic_variance
+        # The prior only depends on the rating and dynamic variance, which
+        # are fixed for the lifetime of the factor
+        sigma: float = sqrt(rating.std ** 2 + dynamic_variance ** 2)
+        self._prior: Gaussian = Gaussian(rating.mu, sigma)
 
     def pass_message_down(self) -> float:
-        sigma: float = sqrt(self.rating.std ** 2 +
-                            self.dynamic_variance ** 2)
-        value: Gaussian = Gaussian(self.rating.mu, sigma)
-        return self.variable.update_value(self, value=value)
+        return self.update_value(0, self._prior.pi, self._prior.tau)
 
 
 class LikelihoodFactor(Factor):
@@ -223,15 +249,17 @@ class LikelihoodFactor(Factor):
 
     def pass_message_down(self) -> float:
         """Update value."""
-        msg: Gaussian = self.mean / self.mean.messages[self]
-        a: float = 1. / (1. + self.variance * msg.pi)
-        return self.value.update_message(self, a * msg.pi, a * msg.tau)
+        pi: float = self.mean._pi - self.pi_msgs[0]
+        a: float = 1. / (1. + self.variance * pi)
+        return self.update_message(
+            1, a * pi, a * (self.mean._tau - self.tau_msgs[0]))
 
     def pass_message_up(self) -> float:
         """Update mean."""
-        msg: Gaussian = self.value / self.value.messages[self]
-        a: float = 1. / (1. + self.variance * msg.pi)
-        return self.mean.update_message(self, a * msg.pi, a * msg.tau)
+        pi: float = self.value._pi - self.pi_msgs[1]
+        a: float = 1. / (1. + self.variance * pi)
+        return self.update_message(
+            0, a * pi, a * (self.value._tau - self.tau_msgs[1]))
 
 
 class SumFactor(Factor):
@@ -244,38 +272,58 @@ class SumFactor(Factor):
         self.sum: Variable = sum_variable
         self.terms: List[Variable] = term_variables
         self.weights: List[int] = weights
-
-    def pass_message_down(self) -> float:
-        msgs: List[Gaussian] = [var.messages[self] for var
-                                in self.terms]
-        return self.update(self.sum, self.terms, msgs, self.weights)
-
-    def pass_message_up(self, index: int = 0) -> float:
+        # The weights and source variables used to update each term from
+        # the sum and the other terms only depend on the factor's weights
+        self._up_weights: List[List[float]] = \
+            [self._term_weights(index) for index in range(len(weights))]
+        self._up_sources: List[List[int]] = \
+            [self._term_sources(index) for index in range(len(weights))]
+
+    def _term_weights(self, index: int) -> List[float]:
         weight: float = self.weights[index]
         weights: List[float] = []
         for i, w in enumerate(self.weights):
             weights.append(0. if weight == 0
                            else 1. / weight if i == index
                            else -w / weight)
-        values = self.terms[:]
-        values[index] = self.sum
-        msgs = [var.messages[self] for var in values]
-        return self.update(self.terms[index], values, msgs, weights)
+        return weights
+
+    def _term_sources(self, index: int) -> List[int]:
+        # Every term but the updated one, whose place the sum takes
+        sources: List[int] = list(range(1, len(self.variables)))
+        sources[index] = 0
+        return sources
 
-    def update(self, variable: Variable, values: List[Variable],
-               msgs: List[Gaussian], weights: List[float]) -> float:
+    def pass_message_down(self) -> float:
+        sources: range = range(1, len(self.variables))
+        return self.update(0, sources, self.weights)
+
+    def pass_message_up(self, index: int = 0) -> float:
+        return self.update(index + 1, self._up_sources[index],
+                           self._up_weights[index])
+
+    def update(self, index: int, sources: List[int],
+               weights: List[float]) -> float:
+        """Updates `variables[index]` from the messages of the variables at
+        the `sources` indices, combined with the given weights"""
         pi_inv: float = 0
         mu: float = 0
-        for value, msg, weight in zip(values, msgs, weights):
-            div: float = value / msg
-            mu += weight * div.mu
-            if pi_inv == INF:
+        for source, weight in zip(sources, weights):
+            variable: Variable = self.variables[source]
+            div_pi: float = variable._pi - self.pi_msgs[source]
+            if div_pi == 0:
+                # Flat message, no contribution to the mean
+                pi_inv = INF
                 continue
-            pi_inv += INF if float(div.pi) == 0 else \
-                weight ** 2 / float(div.pi)
+            # A single division per term, shared by the mean and variance
+            inv_pi: float = 1. / div_pi
+            div_tau: float = variable._tau - self.tau_msgs[source]
+            mu += weight * div_tau * inv_pi
+            if pi_inv != INF:
+                pi_inv += weight * weight * inv_pi
         pi: float = 1. / pi_inv
         tau: float = pi * mu
-        return variable.update_message(self, pi, tau)
+        return self.update_message(index, pi, tau)
 
 
 class TruncateFactor(Factor):
@@ -290,16 +338,17 @@ class TruncateFactor(Factor):
         self.draw_margin: float = draw_margin
 
     def pass_message_up(self) -> float:
-        div: Gaussian = self.variable / self.variable.messages[self]
-        sqrt_pi: float = sqrt(div.pi)
-        diff: float = div.tau / sqrt_pi
+        div_pi: float = self.variable._pi - self.pi_msgs[0]
+        div_tau: float = self.variable._tau - self.tau_msgs[0]
+        sqrt_pi: float = sqrt(div_pi)
+        diff: float = div_tau / sqrt_pi
         draw_margin: float = self.draw_margin * sqrt_pi
         v: float = self.v_func(diff, draw_margin)
         w: float = self.w_func(diff, draw_margin)
         denom: float = 1. - w
-        pi: float = div.pi / denom
-        tau: float = (div.tau + sqrt_pi * v) / denom
-        return self.variable.update_value(self, pi, tau)
+        pi: float = div_pi / denom
+        tau: float = (div_tau + sqrt_pi * v) / denom
+        return self.update_value(0, pi, tau)
 
 
 def v_win(diff: float, draw_margin: float) -> float:
@@ -307,8 +356,8 @@ def v_win(diff: float, draw_margin: float) -> float:
     variation of a mean.
     """
     x: float = diff - draw_margin
-    denom: float = _norm.cdf(x)
-    return (_norm.pdf(x) / denom) if denom else -x
+    denom: float = _cdf(x)
+    return (_pdf(x) / denom) if denom else -x
 
 
 def v_draw(diff: float, draw_margin: float) -> float:
@@ -316,8 +365,8 @@ def v_draw(diff: float, draw_margin: float) -> float:
     abs_diff: float = abs(diff)
     a: float = draw_margin - abs_diff
     b: float = -draw_margin - abs_diff
-    denom: float = _norm.cdf(a) - _norm.cdf(b)
-    numer: float = _norm.pdf(b) - _norm.pdf(a)
+    denom: float = _cdf(a) - _cdf(b)
+    numer: float = _pdf(b) - _pdf(a)
     return ((numer / denom) if denom else a) * (-1 if diff < 0 else +1)
 
 
@@ -338,19 +387,25 @@ def w_draw(diff: float, draw_margin: float) -> float:
     abs_diff: float = abs(diff)
     a: float = draw_margin - abs_diff
     b: float = -draw_margin - abs_diff
-    denom: float = _norm.cdf(a) - _norm.cdf(b)
+    denom: float = _cdf(a) - _cdf(b)
     if denom == 0.:
         raise FloatingPointError()
     v: float = v_draw(abs_diff, draw_margin)
-    return (v ** 2) + (a * _norm.pdf(a) - b * _norm.pdf(b)) / denom
+    return (v ** 2) + (a * _pdf(a) - b * _pdf(b)) / denom
 
 
 def flatten(array: List) -> List:
     """return a flattened copy of an array"""
     new_array = []
-    for x in array:
-        if isinstance(x, List):
-            new_array.extend(flatten(x))
-        else:
+    # Walk the nested lists with an explicit stack of iterators instead of
+    # recursing
+    stack = [iter(array)]
+    while stack:
+        for x in stack[-1]:
+            if isinstance(x, list):
+                stack.append(iter(x))
+                break
             new_array.append(x)
+        else:
+            stack.pop()
     return new_array
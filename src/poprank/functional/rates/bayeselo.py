@@ -15,7 +15,8 @@ def bayeselo(
     players: "list[str]", interactions: "list[Interaction]",
     elos: "list[EloRate]", elo_base: float = 10., elo_spread: float = 400.,
     elo_draw: float = 97.3, elo_advantage: float = 32.8,
-    iterations: int = 10000, tolerance: float = 1e-5
+    iterations: int = 10000, tolerance: float = 1e-5, jacobi: bool = False,
+    rating_class: "type[BayesEloRating]" = BayesEloRating
 ) -> "list[EloRate]":
     """Rates players by calculating their new elo using a bayeselo approach
 
@@ -45,6 +46,14 @@ def bayeselo(
         Defaults to 10000.
     :param float tolerance: The error threshold below which the
         Minorization-Maximization algorithm stopt. Defaults to 1e-5.
+    :param bool jacobi: Update all the ratings at once from the previous
+        iteration with vectorized array operations, rather than one player
+        at a time. Iterations are much cheaper but more of them are needed,
+        and the ratings agree with the default up to the tolerance.
+        Defaults to False.
+    :param type rating_class: The BayesEloRating class running the
+        Minorization-Maximization algorithm, for example a subclass with
+        compiled sweeps. Defaults to BayesEloRating.
 
     :return: The updated ratings of all players
     :rtype: list[EloRate]
@@ -81,11 +90,16 @@ def bayeselo(
         raise ValueError("Players and elos length mismatch"
                          f": {len(players)} != {len(elos)}")
 
-    players_in_interactions = set()
+    players_set = set(players)
+    players_in_interactions_set = set()
 
     for interaction in interactions:
-        players_in_interactions = \
-            players_in_interactions.union(interaction.players)
+        players_in_interactions_set.update(interaction.players)
+
+    unknown_players = players_in_interactions_set - players_set
+    if unknown_players:
+        raise ValueError("Interactions involve players missing from players"
+                         f": {list(unknown_players)}")
 
     def convert_to_elo_rate(elo: Union[float, Rate, EloRate]):
         if not isinstance(elo, EloRate):
@@ -99,13 +113,14 @@ def bayeselo(
 
     elos = list(map(convert_to_elo_rate, elos))
 
+    # Keep the set for membership tests, the list for the players order
     players_in_interactions = [
         player for player in players
-        if player in players_in_interactions
+        if player in players_in_interactions_set
     ]
     elos_to_update = [
         elo for elo, player in zip(elos, players)
-        if player in players_in_interactions
+        if player in players_in_interactions_set
     ]
 
     interactions = to_pairwise(interactions)
@@ -114,10 +129,10 @@ def bayeselo(
         interactions=interactions
     )
 
-    bradley_terry = BayesEloRating(
+    bradley_terry = rating_class(
         pairwise_stats, elos=elos_to_update, elo_draw=elo_draw,
         elo_advantage=elo_advantage,
-        base=elo_base, spread=elo_spread
+        base=elo_base, spread=elo_spread, jacobi=jacobi
     )
 
     bradley_terry.minorize_maximize(
@@ -131,12 +146,9 @@ def bayeselo(
 
     bradley_terry.rescale_elos()
 
-    new_elos = []
-    for i, p in enumerate(players):
-        if p in players_in_interactions:
-            new_elos.append(bradley_terry.elos[0])
-            bradley_terry.elos = bradley_terry.elos[1:]
-        else:
-            new_elos.append(elos[i])
-
-    return new_elos
+    # The updated elos follow the order of players_in_interactions
+    updated_elos = iter(bradley_terry.elos)
+    return [
+        next(updated_elos) if p in players_in_interactions_set else elos[i]
+        for i, p in enumerate(players)
+    ]
@@ -1,10 +1,13 @@
 from math import log
+import numpy as np
+from scipy.special import expit
 from popcore import Interaction, Player
 
-from poprank import Rate
+from poprank import Rate, RateSequence
 from poprank.functional.math import sigmoid
-from poprank.utils import to_pairwise
-from .wdl import windrawlose
+from poprank.utils import (
+    InteractionBatch, _to_arrays, player_indices, to_pairwise
+)
 
 
 class EloRate(Rate):
@@ -37,8 +40,7 @@ class EloRate(Rate):
         if not isinstance(opponent_elo, EloRate):
             raise TypeError("opponent_elo should be of type EloRate")
 
-        return sigmoid(
-            (opponent_elo.mu - self.mu) / self.spread, base=self.base)
+        return sigmoid(self.q * (self.mu - opponent_elo.mu))
 
     @property
     def q(self):
@@ -51,6 +53,79 @@ class EloRate(Rate):
         )
 
 
+class EloRateSequence(RateSequence):
+    """
+        Read-only sequence of elo ratings stored as parallel arrays of means
+        and standard deviations, all sharing one base and spread.
+        :meth:`elo` updates it without an EloRate object per player.
+
+        :param np.ndarray mus: Means
+        :param np.ndarray stds: Standard deviations, same length as `mus`
+        :param float base: base of the exponent in the elo formula
+        :param float spread: divisor of the exponent in the elo formula
+        :param np.dtype dtype: Floating point type of the arrays. With
+            float32, elo() also updates the ratings in float32, which is
+            precise enough for ratings in the thousands. Defaults to float64
+    """
+    def __init__(
+        self, mus: np.ndarray, stds: np.ndarray,
+        base: float = 10, spread: float = 400.0, dtype=np.float64
+    ) -> None:
+        super().__init__(mus, stds, dtype)
+        self.base = base
+        self.spread = spread
+
+    @classmethod
+    def from_rates(
+        cls, elos: "list[EloRate]", dtype=np.float64
+    ) -> "EloRateSequence":
+        """Gather a list of elo ratings into a sequence.
+
+        :param list[EloRate] elos: Ratings sharing the same base and spread
+        :param np.dtype dtype: Floating point type of the sequence
+        :return: The ratings as a sequence.
+        :rtype: EloRateSequence"""
+        base, spread = (elos[0].base, elos[0].spread) if elos else (10, 400.)
+        if any(elo.base != base or elo.spread != spread for elo in elos):
+            raise ValueError("Elos do not share the same base and spread")
+
+        return cls(
+            np.fromiter((elo.mu for elo in elos), dtype, len(elos)),
+            np.fromiter((elo.std for elo in elos), dtype, len(elos)),
+            base, spread, dtype
+        )
+
+    @property
+    def q(self):
+        return log(self.base) / self.spread
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EloRateSequence(
+                self.mus[index], self.stds[index], self.base, self.spread,
+                self.mus.dtype)
+        return EloRate(float(self.mus[index]), float(self.stds[index]),
+                       self.base, self.spread)
+
+    def __repr__(self) -> str:
+        return (
+            f"EloRateSequence(mus={self.mus!r}, stds={self.stds!r}, "
+            f"base={self.base}, spread={self.spread})"
+        )
+
+
+# Outcomes elo accepts without wdl
+_VALID_OUTCOMES = frozenset((0, .5, 1))
+
+_OUTCOMES_WARNING = (
+    "Elo takes outcomes in the (1, 0), (0, 1), (.5, .5) format, other values "
+    "may have unspecified behavior (set wdl=True to automatically turn "
+    "interactions into the windrawlose format)")
+
+# q of an EloRate with the default base and spread, for plain Rates
+_DEFAULT_Q: float = log(10.) / 400.
+
+
 def _elo_update(
     elo: EloRate, true_score: float,
     expected_score: float, k_factor: float
@@ -62,80 +137,78 @@ def _elo_update(
 
 
 def _agg(
-    players: "list[str]", interactions: "list[Interaction]",
-    elos: "list[EloRate]", k_factor: float, wdl: bool
-):
-    """_summary_
-
-    :param population: _description_
-    :type population: Population
-    :param interactions: _description_
-    :type interactions: list[Interaction]
-    :param elos: _description_
-    :type elos: list[EloRate]
-    :param k_factor: _description_
+    players: "list[str]", player_idx: np.ndarray, opponent_idx: np.ndarray,
+    outcomes: np.ndarray, mus: np.ndarray, qs: np.ndarray,
+    k_factor: float
+) -> np.ndarray:
+    """Applies the elo update of all the interactions at once: every
+    player moves by k_factor times the sum of its true scores minus the
+    sum of its expected scores, all computed from the initial elos.
+
+    :param players: The players, only their number is used
+    :type players: list[str]
+    :param player_idx: Index of the first player of every interaction
+    :type player_idx: np.ndarray
+    :param opponent_idx: Index of the second player of every interaction
+    :type opponent_idx: np.ndarray
+    :param outcomes: The (n, 2) outcomes of every pairwise interaction
+    :type outcomes: np.ndarray
+    :param mus: Elo of every player
+    :type mus: np.ndarray
+    :param qs: ln(base) / spread of every player, the expected score of
+        a player against an opponent is expit(q * (mu - mu_opponent))
+    :type qs: np.ndarray
+    :param k_factor: Maximum possible adjustment per game
     :type k_factor: float
-    :param wdl: _description_
-    :type wdl: bool
-    :return: _description_
-    :rtype: _type_
+    :return: The updated elo of every player, in the dtype of `mus`
+    :rtype: np.ndarray
     """
 
-    exp_scores = [.0 for _ in players]
-    true_scores = [.0 for _ in players]
+    outcomes = np.array(outcomes, dtype=mus.dtype).reshape(-1, 2)
 
-    for interaction in interactions:
-        player = players.index(interaction.players[0])
-        opponent = players.index(interaction.players[1])
+    # Expected score of both sides of every interaction, each with its own
+    # base and spread
+    diffs = mus[player_idx] - mus[opponent_idx]
+    exp_player = expit(qs[player_idx] * diffs)
+    exp_opponent = expit(-qs[opponent_idx] * diffs)
 
-        exp_scores[player] += elos[player].predict(elos[opponent])
-        exp_scores[opponent] += elos[opponent].predict(elos[player])
+    num_players = len(players)
 
-        true_scores[players.index(interaction.players[0])] += \
-            interaction.outcomes[0]
-        true_scores[players.index(interaction.players[1])] += \
-            interaction.outcomes[1]
+    # Per-player sums over both sides of the interactions, as weighted
+    # bincounts rather than unbuffered np.add.at scatters
+    exp_scores = np.bincount(player_idx, exp_player, num_players)
+    exp_scores += np.bincount(opponent_idx, exp_opponent, num_players)
+    true_scores = np.bincount(player_idx, outcomes[:, 0], num_players)
+    true_scores += np.bincount(opponent_idx, outcomes[:, 1], num_players)
 
-    if wdl:
-        true_scores = [r.mu for r in
-                       windrawlose(players=players,
-                                   interactions=interactions,
-                                   ratings=[Rate(0, 0) for p in players],
-                                   win_value=1,
-                                   draw_value=.5,
-                                   loss_value=0)]
-    # New elo values
-    u_elos: "list[EloRate]" = []
-    for idx, elo in enumerate(elos):
-        u_elo = _elo_update(
-            elo, true_score=true_scores[idx],
-            expected_score=exp_scores[idx], k_factor=k_factor
-        )
-        u_elos.append(EloRate(u_elo, elo.std))
-
-    return u_elos
+    # New elo values, in the precision of the ratings (bincount sums in
+    # float64)
+    return mus + (k_factor * (true_scores - exp_scores)).astype(mus.dtype)
 
 
 def _stream(
-    players: "list[Player]", interactions: "list[Interaction]",
-    elos: "list[EloRate]", k_factor: float, wdl: bool
+    players: "list[Player]", player_idx: "list[int]",
+    opponent_idx: "list[int]", outcomes: "list[list[float]]",
+    elos: "list[EloRate]", k_factor: float
 ):
     """
         TODO:
     """
-    u_elos = [EloRate(o_elo.mu, o_elo.std) for o_elo in elos]
-
-    for interaction in interactions:
-        player = players.index(interaction.players[0])
-        opponent = players.index(interaction.players[1])
+    u_elos = [
+        EloRate(o_elo.mu, o_elo.std, o_elo.base, o_elo.spread)
+        if isinstance(o_elo, EloRate) else EloRate(o_elo.mu, o_elo.std)
+        for o_elo in elos]
 
+    for player, opponent, (outcome, opp_outcome) in zip(
+        player_idx, opponent_idx, outcomes
+    ):
         u_elos[player].mu = _elo_update(
-            elo=u_elos[player], true_score=interaction.outcomes[0],
+            elo=u_elos[player], true_score=outcome,
             expected_score=u_elos[player].predict(u_elos[opponent]),
             k_factor=k_factor
         )
-        elos[opponent].mu = _elo_update(
-            elo=u_elos[opponent], true_score=interaction.outcomes[1],
+        u_elos[opponent].mu = _elo_update(
+            elo=u_elos[opponent], true_score=opp_outcome,
             expected_score=u_elos[opponent].predict(u_elos[player]),
             k_factor=k_factor
         )
@@ -143,10 +216,93 @@ def _stream(
     return u_elos
 
 
+def _interaction_arrays(
+    players: "list[Player]", interactions: "list[Interaction]",
+    wdl: bool, validate: bool
+) -> "tuple[np.ndarray, np.ndarray, np.ndarray]":
+    """
+        Checks the interactions and gathers the player indices and outcomes
+        of their pairwise form.
+    """
+    if isinstance(interactions, InteractionBatch):
+        # Already pairwise, indexed like players
+        interactions.check_players(players)
+        if validate and not wdl and not (
+                np.isin(interactions.outcomes, (0, .5, 1)).all() and
+                (interactions.outcomes.sum(axis=1) == 1).all()):
+            raise Warning(_OUTCOMES_WARNING)
+
+        player_idx = interactions.player_idx
+        opponent_idx = interactions.opponent_idx
+        outcomes = interactions.outcomes
+    else:
+        if validate and not wdl:
+            for interaction in interactions:
+                outcomes = interaction.outcomes
+                if (outcomes[0] not in _VALID_OUTCOMES or
+                        outcomes[1] not in _VALID_OUTCOMES or
+                        sum(outcomes) != 1):
+                    raise Warning(_OUTCOMES_WARNING)
+
+        player_idx, opponent_idx, outcomes = _to_arrays(
+            to_pairwise(interactions), player_indices(players))
+
+    if wdl:
+        # Score wins, draws and losses as 1, .5 and 0, like windrawlose,
+        # once for both reductions
+        outcomes = np.asarray(outcomes, dtype=np.float64).reshape(-1, 2)
+        scores = .5 * (1. + np.sign(outcomes[:, 0] - outcomes[:, 1]))
+        outcomes = np.stack((scores, 1. - scores), axis=1)
+
+    return player_idx, opponent_idx, outcomes
+
+
+def elo_mu(
+    players: "list[Player]", interactions: "list[Interaction]",
+    mus: np.ndarray, k_factor: float = 20, wdl: bool = False,
+    base: float = 10, spread: float = 400.0, validate: bool = True
+) -> np.ndarray:
+    """Rates players like :meth:`elo` with `reduce="aggregate"`, on an
+    array of elos rather than EloRate objects. Nothing is allocated per
+    player, which suits leaderboards that only read the means.
+
+    :param list[str] players: A list containing all unique player identifiers
+    :param list[Interaction] interactions: A list containing the interactions
+        to get a rating from, or an InteractionBatch indexed like `players`
+    :param np.ndarray mus: The initial elo of the players
+    :param float k_factor: Maximum possible adjustment per game. Defaults
+        to 20
+    :param bool wdl: Turn the interactions into the (1, 0), (.5, .5),
+        (0, 1) format automatically. Defaults to False.
+    :param float base: base of the exponent in the elo formula
+    :param float spread: divisor of the exponent in the elo formula
+    :param bool validate: Check that every outcome is a win (1, 0), a
+        loss (0, 1) or a draw (.5, .5), unless `wdl` maps them. False
+        skips only this check, unknown players always raise. Defaults to
+        True.
+    :raises ValueError: If the numbers of players and elos don't match,
+        If an InteractionBatch is not indexed like `players`
+    :return: The updated elo of the players
+    :rtype: np.ndarray
+    """
+    mus = np.asarray(mus)
+    if not np.issubdtype(mus.dtype, np.floating):
+        mus = mus.astype(np.float64)
+    if len(players) != len(mus):
+        raise ValueError("Players and elos length mismatch"
+                         f": {len(players)} != {len(mus)}")
+
+    player_idx, opponent_idx, outcomes = _interaction_arrays(
+        players, interactions, wdl, validate)
+    qs = np.full(len(mus), log(base) / spread, mus.dtype)
+    return _agg(players, player_idx, opponent_idx, outcomes, mus, qs,
+                k_factor)
+
+
 def elo(
     players: "list[Player]", interactions: "list[Interaction]",
     elos: "list[EloRate]", k_factor: float = 20,
-    wdl: bool = False, reduce: str = "aggregate"
+    wdl: bool = False, reduce: str = "aggregate", validate: bool = True
 ) -> "list[EloRate]":
     """Rates players by calculating their new elo after a set of interactions.
 
@@ -158,23 +314,34 @@ def elo(
     set by aggregating all interaction use `reduce`= aggregate (default). To 
     compute ratings after each interaction, use `reduce` = stream.
 
-    :param list[str] players: A list containing all unique player identifiers
+    :param list[str] players: A list containing all unique player identifiers.
+        An IndexedPlayers reuses its index across calls
     :param list[Interaction] interactions: A list containing the interactions
         to get a rating from. Every interaction should be between exactly 2
         players and result in a win (1, 0), a loss (0, 1)
-        or a draw (0.5, 0.5)
-    :param list[EloRate] elos: The initial ratings of the players
+        or a draw (0.5, 0.5). An InteractionBatch indexed like `players`
+        is used as is, which skips parsing the interactions on every call
+    :param list[EloRate] elos: The initial ratings of the players. An
+        EloRateSequence is updated as arrays and returned as an
+        EloRateSequence
     :param float k_factor: Maximum possible adjustment per game. Larger means
         player rankings change faster
     :param str reduce: The aggregation method used to reduce the interactions. Values
         can be either "aggregate" or "stream".
     :param bool wdl: Turn the interactions into the (1, 0), (.5, .5),
         (0, 1) format automatically. Defaults to False.
+    :param bool validate: Check that every outcome is a win (1, 0), a
+        loss (0, 1) or a draw (.5, .5), unless `wdl` maps them. Trusted
+        inputs can skip this check with False, unknown players and an
+        InteractionBatch indexed like other players always raise.
+        Defaults to True.
 
     :raises ValueError: If the numbers of players and ratings don't match,
             If an interaction has the wrong number of players,
             If an interaction has the wrong number of outcomes,
-            If a player that does not appear in `players`is in an interaction
+            If a player that does not appear in `players` is in an
+            interaction,
+            If an InteractionBatch is not indexed like `players`
     :raises TypeError: Using Rate instead of EloRate
 
     :return: The updated ratings of all players
@@ -268,24 +435,39 @@ def elo(
         raise ValueError("Players and elos length mismatch"
                          f": {len(players)} != {len(elos)}")
 
-    for interaction in interactions:
-        if not wdl and (interaction.outcomes[0] not in (0, .5, 1) or
-                        interaction.outcomes[1] not in (0, .5, 1) or
-                        sum(interaction.outcomes) != 1):
-            raise Warning("Elo takes outcomes in the (1, 0), (0, 1), (.5, .5) "
-                          "format, other values may have unspecified behavior "
-                          "(set wdl=True to automatically turn interactions "
-                          "into the windrawlose format)")
+    player_idx, opponent_idx, outcomes = _interaction_arrays(
+        players, interactions, wdl, validate)
 
     # Calculate the expected score vs true score of all players in the given
     # set of interactions and adjust elo afterwards accordingly.
 
-    interactions = to_pairwise(interactions)
-
     if reduce == "aggregate":
-        rates = _agg(players, interactions, elos, k_factor, wdl)
+        if isinstance(elos, EloRateSequence):
+            new_mus = _agg(
+                players, player_idx, opponent_idx, outcomes, elos.mus,
+                np.full(len(elos), elos.q, elos.mus.dtype), k_factor)
+            return EloRateSequence(new_mus, elos.stds, elos.base, elos.spread,
+                                   elos.mus.dtype)
+
+        mus = np.fromiter((elo.mu for elo in elos), np.float64, len(elos))
+        # base ** (x / spread) == exp(q * x), with q = ln(base) / spread
+        qs = np.fromiter(
+            (elo.q if isinstance(elo, EloRate) else _DEFAULT_Q
+             for elo in elos), np.float64, len(elos))
+        new_mus = _agg(players, player_idx, opponent_idx, outcomes, mus, qs,
+                       k_factor)
+        # tolist() converts once to native floats. The new ratings keep the
+        # std, base and spread of the old ones
+        rates = [
+            EloRate(mu, elo.std, elo.base, elo.spread)
+            if isinstance(elo, EloRate) else EloRate(mu, elo.std)
+            for mu, elo in zip(new_mus.tolist(), elos)]
     elif reduce == "stream":
-        rates = _stream(players, interactions, elos, k_factor, wdl)
+        rates = _stream(
+            players, player_idx.tolist(), opponent_idx.tolist(),
+            np.asarray(outcomes).tolist(), list(elos), k_factor)
+        if isinstance(elos, EloRateSequence):
+            return EloRateSequence.from_rates(rates, elos.mus.dtype)
     else:
         raise ValueError("reduce")
 
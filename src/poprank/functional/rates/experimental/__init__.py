@@ -1,6 +1,8 @@
+from .bradleyterry import bradleyterry
+from .kemeny import kemeny_young
 from .laplacian import laplacian
 
 
 __all__ = [
-    "laplacian"
+    "bradleyterry", "kemeny_young", "laplacian"
 ]
@@ -0,0 +1,138 @@
+from typing import List, Optional
+import numpy as np
+from scipy.sparse import coo_matrix
+
+from popcore import Interaction, Player
+from poprank import Rate
+from poprank.utils import InteractionBatch
+
+
+# Hunter, David R.
+# “MM Algorithms for Generalized Bradley-Terry Models.”
+# The Annals of Statistics, vol. 32, no. 1, Feb. 2004
+# pp. 384–406, https://doi.org/10.1214/aos/1079120141.
+
+# Newman, M. E. J.
+# “Efficient Computation of Rankings from Pairwise Comparisons.”
+# Journal of Machine Learning Research, vol. 24, no. 238, 2023
+# pp. 1–25, http://jmlr.org/papers/v24/22-1086.html.
+
+def bradleyterry(
+    players: List[Player],
+    interactions: List[Interaction],
+    rates: Optional[List[Rate]] = None,
+    iterations: int = 100,
+    normalize: bool = True,
+    newman: bool = False
+) -> List[Rate]:
+    """Rate the players with the minorization-maximization (MM) algorithm
+    for the Bradley-Terry model, where player i beats player j with
+    probability pi_i / (pi_i + pi_j).
+
+    :param list[Player] players: The players to rate. An IndexedPlayers
+        reuses its index across calls
+    :param list[Interaction] interactions: The interactions between the
+        players, or an InteractionBatch indexed like `players`. Each outcome
+        counts as the share of a win, so a draw is half a win for both
+        players. The outcomes of an interaction must be in [0, 1] and sum
+        to 1
+    :param list[Rate] rates: The initial strengths pi of the players, which
+        must be positive (not log-strengths), defaults to a strength of 1
+        for everyone. Players without interactions keep their initial
+        strength, so without any interactions the result is the initial
+        strengths
+    :param int iterations: The number of MM sweeps, defaults to 100
+    :param bool normalize: Rescale the strengths to sum to 1 after every
+        sweep, defaults to True
+    :param bool newman: Use Newman's iteration instead of Hunter's MM. It
+        converges to the same strengths in far fewer sweeps. Players that
+        never lost keep their current strength. Defaults to False
+    :raises ValueError: If the numbers of players and rates don't match,
+        If an initial strength is not positive,
+        If the outcomes of an interaction are not shares of a win,
+        If an InteractionBatch is not indexed like `players`
+    :return: The strength pi of every player
+    :rtype: list[Rate]
+    """
+
+    if rates is not None and len(rates) != len(players):
+        raise ValueError("Players and rates length mismatch"
+                         f": {len(players)} != {len(rates)}")
+
+    if isinstance(interactions, InteractionBatch):
+        interactions.check_players(players)
+    else:
+        interactions = InteractionBatch.from_interactions(
+            players, interactions)
+    num_players = len(players)
+
+    player_idx = interactions.player_idx
+    opponent_idx = interactions.opponent_idx
+    outcomes = interactions.outcomes
+    if not (((outcomes >= 0.) & (outcomes <= 1.)).all() and
+            np.allclose(outcomes.sum(axis=1), 1.)):
+        raise ValueError("Outcomes must be shares of a win: in [0, 1] and "
+                         "summing to 1")
+
+    # Wins of every player, built once
+    wins = np.bincount(player_idx, outcomes[:, 0], num_players)
+    wins += np.bincount(opponent_idx, outcomes[:, 1], num_players)
+
+    # Games played between every pair, built once. Most pairs never meet,
+    # so only the pairs that did are stored (CSR sums duplicate pairs)
+    pairs = player_idx != opponent_idx
+    rows = np.concatenate((player_idx[pairs], opponent_idx[pairs]))
+    cols = np.concatenate((opponent_idx[pairs], player_idx[pairs]))
+    games = coo_matrix(
+        (np.ones(rows.size), (rows, cols)),
+        shape=(num_players, num_players)
+    ).tocsr()
+    if newman:
+        # Wins of the row player over the column player, on the same
+        # entries as games
+        pair_wins = coo_matrix(
+            (np.concatenate((outcomes[pairs, 0], outcomes[pairs, 1])),
+             (rows, cols)),
+            shape=(num_players, num_players)
+        ).tocsr().data
+        pair_losses = games.data - pair_wins
+    rows = np.repeat(np.arange(num_players), np.diff(games.indptr))
+    cols = games.indices
+
+    if rates is None:
+        pi = np.ones(num_players)
+    else:
+        pi = np.fromiter((rate.mu for rate in rates), np.float64, num_players)
+        if not (pi > 0.).all():
+            raise ValueError("Initial strengths must be positive")
+
+    ratio = np.empty_like(games.data)
+    if newman:
+        for _ in range(iterations):
+            # pi_i <- sum_j W_ij pi_j / (pi_i + pi_j)
+            #         / sum_j W_ji / (pi_i + pi_j)
+            pi_cols = pi[cols]
+            denom = pi[rows] + pi_cols
+            ratio.fill(0.)
+            np.divide(pi_cols, denom, out=ratio, where=denom > 0.)
+            won = np.bincount(rows, pair_wins * ratio, num_players)
+            ratio.fill(0.)
+            np.divide(pair_losses, denom, out=ratio, where=denom > 0.)
+            lost = np.bincount(rows, ratio, num_players)
+            pi = np.divide(won, lost, out=pi.copy(), where=lost > 0.)
+            if normalize and pi.sum() > 0.:
+                pi /= pi.sum()
+
+        return [Rate(mu) for mu in pi.tolist()]
+
+    for _ in range(iterations):
+        # pi_i <- W_i / sum_j N_ij / (pi_i + pi_j), over the nonzero N_ij
+        denom = pi[rows] + pi[cols]
+        ratio.fill(0.)
+        np.divide(games.data, denom, out=ratio, where=denom > 0.)
+        totals = np.bincount(rows, ratio, num_players)
+        pi = np.divide(wins, totals, out=pi.copy(), where=totals > 0.)
+        if normalize and pi.sum() > 0.:
+            pi /= pi.sum()
+
+    return [Rate(mu) for mu in pi.tolist()]
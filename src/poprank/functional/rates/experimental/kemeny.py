@@ -0,0 +1,140 @@
+from itertools import permutations
+from typing import List
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+from scipy.sparse import coo_matrix
+
+from popcore import Interaction, Player
+from poprank import Rank
+from poprank.utils import _to_arrays, player_indices, to_pairwise
+
+
+# Kemeny, John G.
+# “Mathematics without Numbers.”
+# Daedalus, vol. 88, no. 4, 1959
+# pp. 577–591, https://www.jstor.org/stable/20026529.
+
+# Rankings of at most this many players are searched exactly with the
+# dynamic program on subsets, larger ones are solved as an ILP
+_SUBSETS_MAX_PLAYERS = 12
+
+
+def _preferences(
+    players: List[Player], interactions: List[Interaction]
+) -> np.ndarray:
+    """C[i, j] is the number of pairwise interactions in which player i
+    scored more than player j"""
+    player_idx, opponent_idx, outcomes = _to_arrays(
+        to_pairwise(interactions), player_indices(players))
+
+    wins = outcomes[:, 0] > outcomes[:, 1]
+    losses = outcomes[:, 0] < outcomes[:, 1]
+    num_players = len(players)
+    preferences = np.zeros((num_players, num_players))
+    np.add.at(preferences, (player_idx[wins], opponent_idx[wins]), 1.)
+    np.add.at(preferences, (opponent_idx[losses], player_idx[losses]), 1.)
+    return preferences
+
+
+def _kemeny_subsets(preferences: np.ndarray) -> List[int]:
+    """Kemeny order, best first, by dynamic programming over the subsets
+    of players: the cheapest order of a subset S ends with the player i
+    minimizing cost(S - {i}) + sum_{j in S - {i}} C[i, j]"""
+    num_players = len(preferences)
+    subsets = np.arange(1 << num_players)
+    members = (subsets[:, None] >> np.arange(num_players)) & 1
+    # below[S, i]: disagreements of placing i below every player of S
+    below = members @ preferences.T
+
+    cost = np.zeros(1 << num_players)
+    last = np.zeros(1 << num_players, dtype=np.intp)
+    for subset in range(1, 1 << num_players):
+        candidates = np.flatnonzero(members[subset])
+        rests = subset ^ (1 << candidates)
+        costs = cost[rests] + below[rests, candidates]
+        best = np.argmin(costs)
+        cost[subset] = costs[best]
+        last[subset] = candidates[best]
+
+    order = []
+    subset = (1 << num_players) - 1
+    while subset:
+        order.append(last[subset])
+        subset ^= 1 << last[subset]
+    return order[::-1]
+
+
+def _kemeny_ilp(preferences: np.ndarray) -> List[int]:
+    """Kemeny order, best first, as an ILP over the binary variables
+    x_ij = 1 if i is above j, with x_ij + x_ji = 1 and the transitivity
+    constraints x_ij + x_jk - x_ik <= 1"""
+    num_players = len(preferences)
+    variable = np.arange(num_players * num_players).reshape(
+        num_players, num_players)
+
+    # Above i, j disagrees with the C[j, i] interactions j won
+    objective = preferences.T.ravel().copy()
+
+    i, j = np.triu_indices(num_players, 1)
+    rows = np.repeat(np.arange(i.size), 2)
+    antisymmetry = coo_matrix(
+        (np.ones(rows.size),
+         (rows, np.stack((variable[i, j], variable[j, i]), 1).ravel())),
+        shape=(i.size, num_players * num_players))
+
+    triples = np.array(
+        list(permutations(range(num_players), 3)), dtype=np.intp)
+    i, j, k = triples.T
+    rows = np.repeat(np.arange(len(triples)), 3)
+    transitivity = coo_matrix(
+        (np.tile([1., 1., -1.], len(triples)),
+         (rows, np.stack(
+             (variable[i, j], variable[j, k], variable[i, k]), 1).ravel())),
+        shape=(len(triples), num_players * num_players))
+
+    # The diagonal is fixed to 0 by its bounds
+    upper = np.ones(num_players * num_players)
+    upper[np.diag(variable)] = 0.
+    result = milp(
+        objective, integrality=np.ones(objective.size),
+        bounds=Bounds(0., upper),
+        constraints=[
+            LinearConstraint(antisymmetry, 1., 1.),
+            LinearConstraint(transitivity, -np.inf, 1.)
+        ])
+    if not result.success:
+        raise RuntimeError(f"kemeny_young: {result.message}")
+
+    above = np.rint(result.x).reshape(num_players, num_players)
+    return np.argsort(-above.sum(axis=1), kind="stable").tolist()
+
+
+def kemeny_young(
+    players: List[Player], interactions: List[Interaction]
+) -> Rank:
+    """Rank the players with the Kemeny-Young method: the order that
+    disagrees with the fewest pairwise results. Every interaction counts
+    as a vote for the players that scored more over those that scored
+    less.
+
+    Small populations are searched exactly by dynamic programming over
+    the subsets of players, in O(n 2^n). Larger ones are solved as an
+    integer linear program with scipy.optimize.milp.
+
+    :param list[Player] players: The players to rank
+    :param list[Interaction] interactions: The interactions between the
+        players
+    :raises ValueError: If a player that does not appear in `players` is in
+        an interaction
+    :return: The players' indices from the last ranked to the first, like
+        the ranks of RankModule
+    :rtype: Rank
+    """
+    preferences = _preferences(players, interactions)
+
+    if len(players) <= _SUBSETS_MAX_PLAYERS:
+        order = _kemeny_subsets(preferences)
+    else:
+        order = _kemeny_ilp(preferences)
+
+    return Rank(order[::-1])
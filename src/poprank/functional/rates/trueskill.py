@@ -1,7 +1,7 @@
 from copy import deepcopy
 from math import sqrt
 from typing import Callable
-from statistics import NormalDist
+from scipy.special import ndtri
 from popcore import Interaction, Coalition, Player
 
 from ._trueskill.factor_graph import (
@@ -147,6 +147,10 @@ def trueskill(
     new_ratings: "list[TrueSkillRate]" = flatten(new_ratings_reformatted)
     player_names: list[str] = [p for t in teams for p in t.members]
 
+    # Draw margin of a single player, scaled by the number of players in
+    # each pair of teams below
+    unit_draw_margin: float = float(ndtri((draw_probability + 1) / 2.)) * beta
+
     for interaction in interactions:
         # ------ Sort rating groups by rank ------ #
 
@@ -228,9 +232,7 @@ def trueskill(
         for i, team_diff_var in enumerate(team_diff_variables):
             # TODO: Make if statement for dynamic draw probability
             size: int = sum([len(x) for x in sorted_ratings[i:i+2]])
-            draw_margin: float = \
-                NormalDist().inv_cdf((draw_probability + 1) / 2.) \
-                * sqrt(size) * beta
+            draw_margin: float = unit_draw_margin * sqrt(size)
             v_func: Callable[[float, float], float]
             w_func: Callable[[float, float], float]
             v_func, w_func = (v_draw, w_draw) if ranks[i] == ranks[i + 1] \
@@ -1,4 +1,6 @@
-from typing import List, Optional
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
 import numpy as np
 
 from .core import Interaction, Population
@@ -22,6 +24,167 @@ def to_pairwise(interactions: List[Interaction]) -> List[Interaction]:
     return pairwise
 
 
+class IndexedPlayers(Sequence):
+    """
+        Read-only sequence of player identifiers that keeps the index of
+        every player. `index` and `in` are dict lookups instead of scans,
+        and rating methods reuse the index rather than rebuilding it on
+        every call.
+
+    :param players: identifiers of the players, without duplicates.
+    :type players: Iterable[str]
+    """
+    def __init__(self, players: Iterable[str]) -> None:
+        self._players = list(players)
+        self.indices: Dict[str, int] = {
+            player: i for i, player in enumerate(self._players)}
+        if len(self.indices) != len(self._players):
+            raise ValueError("Players are not unique")
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return IndexedPlayers(self._players[index])
+        return self._players[index]
+
+    def __contains__(self, player) -> bool:
+        return player in self.indices
+
+    def index(self, player) -> int:
+        try:
+            return self.indices[player]
+        except KeyError:
+            raise ValueError(f"{player!r} is not in players") from None
+
+    def __repr__(self) -> str:
+        return f"IndexedPlayers({self._players!r})"
+
+
+def player_indices(players: List[str]) -> Dict[str, int]:
+    """
+        Maps every player to its index in `players`, reusing the index of
+        an `IndexedPlayers`.
+
+    :param players: identifiers of the players.
+    :type players: List[str] | IndexedPlayers
+    :return: index of every player.
+    :rtype: Dict[str, int]
+    """
+    if isinstance(players, IndexedPlayers):
+        return players.indices
+    return {player: i for i, player in enumerate(players)}
+
+
+@dataclass
+class InteractionBatch:
+    """
+        Struct-of-arrays representation of a list of pairwise interactions.
+        Players are stored as indices into `players`, which keeps large
+        interaction lists compact and lets rating methods work on them with
+        bulk array operations.
+
+    :param players: identifiers of the players, indexed by the arrays below.
+    :type players: List[str]
+    :param player_idx: (n,) index of the first player.
+    :type player_idx: np.ndarray
+    :param opponent_idx: (n,) index of the second player.
+    :type opponent_idx: np.ndarray
+    :param outcomes: (n, 2) float64 outcomes of both players.
+    :type outcomes: np.ndarray
+    """
+    players: List[str]
+    player_idx: np.ndarray
+    opponent_idx: np.ndarray
+    outcomes: np.ndarray
+
+    @classmethod
+    def from_interactions(
+        cls, players: List[str], interactions: List[Interaction]
+    ) -> "InteractionBatch":
+        """
+            Gathers interactions into a batch indexed like `players`, so
+            rating methods called many times over the same interactions
+            parse them only once.
+
+        :param players: identifiers of the players.
+        :type players: List[str] | IndexedPlayers
+        :param interactions: interactions between the players, converted
+            to pairwise interactions.
+        :type interactions: List[Interaction]
+        :raises ValueError: If an interaction involves an unknown player.
+        :return: the batch.
+        :rtype: InteractionBatch
+        """
+        player_idx, opponent_idx, outcomes = _to_arrays(
+            to_pairwise(interactions), player_indices(players))
+
+        return cls(list(players), player_idx, opponent_idx, outcomes)
+
+    def check_players(self, players: List[str]) -> None:
+        """
+            Checks that the batch is indexed like `players`.
+
+        :param players: identifiers of the players, in the order of the
+            ratings they are rated with.
+        :type players: List[str] | IndexedPlayers
+        :raises ValueError: If `players` differs from the players of the
+            batch.
+        """
+        if players is not self.players and list(players) != self.players:
+            raise ValueError(
+                "The interaction batch is not indexed like players")
+
+    def __len__(self) -> int:
+        return len(self.player_idx)
+
+    def __iter__(self) -> Iterator[Interaction]:
+        """
+            Materializes the batch back into `Interaction` objects, one
+            at a time.
+        """
+        players = self.players
+        for player, opponent, outcomes in zip(
+            self.player_idx.tolist(), self.opponent_idx.tolist(),
+            self.outcomes.tolist()
+        ):
+            yield Interaction(
+                [players[player], players[opponent]], tuple(outcomes))
+
+
+def _to_arrays(
+    interactions: List[Interaction], index: Mapping[str, int]
+) -> "tuple[np.ndarray, np.ndarray, np.ndarray]":
+    """
+        Gathers the player indices and outcomes of a list of pairwise
+        interactions into arrays. Outcomes are kept in float64, so close
+        scores still compare as a win or a loss.
+
+    :param interactions: pairwise interactions.
+    :type interactions: List[Interaction]
+    :param index: index of every player, a Population or the mapping
+        returned by `player_indices`.
+    :type index: Mapping[str, int]
+    :raises ValueError: If an interaction involves an unknown player.
+    :return: player indices, opponent indices and a (n, 2) outcome array.
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    try:
+        player = np.fromiter(
+            (index[i.players[0]] for i in interactions), np.intp,
+            len(interactions))
+        opponent = np.fromiter(
+            (index[i.players[1]] for i in interactions), np.intp,
+            len(interactions))
+    except KeyError as e:
+        raise ValueError(f"Player {e.args[0]} is not in players") from None
+    outcomes = np.array(
+        [i.outcomes for i in interactions], dtype=np.float64).reshape(-1, 2)
+
+    return player, opponent, outcomes
+
+
 def to_payoff_matrix(
     interactions: List[Interaction],
     population: Optional[Population] = None,
@@ -44,19 +207,17 @@ def to_payoff_matrix(
     if population is None:
         population = Population.from_players_interactions(interactions)
 
+    if reduction == "avg":
+        raise NotImplementedError()
+    elif reduction != "sum":
+        raise ValueError()  # TODO: Execption handling.
+
     payoffs = np.zeros(
         shape=(population.size, population.size), dtype=np.float32)
 
-    for interaction in interactions:
-        player = population[interaction.players[0]]
-        opponent = population[interaction.players[1]]
-        if reduction == "sum":
-            payoffs[player, opponent] += interaction.outcomes[0]
-            payoffs[opponent, player] += interaction.outcomes[1]
-        elif reduction == "avg":
-            raise NotImplementedError()
-        else:
-            raise ValueError()  # TODO: Execption handling.
+    player, opponent, outcomes = _to_arrays(interactions, population)
+    np.add.at(payoffs, (player, opponent), outcomes[:, 0])
+    np.add.at(payoffs, (opponent, player), outcomes[:, 1])
 
     return payoffs + 1e-5
 
@@ -89,16 +250,11 @@ def to_win_matrix(
     win_matrix = np.zeros(
         shape=(population.size, population.size), dtype=np.float32)
 
-    for interaction in interactions:
-        player = population[interaction.players[0]]
-        opponent = population[interaction.players[1]]
-
-        player_outcome, opponent_outcome = interaction.outcomes
-
-        if player_outcome > opponent_outcome:
-            win_matrix[player, opponent] += 1.0
-        elif player_outcome < opponent_outcome:
-            win_matrix[opponent, player] += 1.0
+    player, opponent, outcomes = _to_arrays(interactions, population)
+    wins = outcomes[:, 0] > outcomes[:, 1]
+    losses = outcomes[:, 0] < outcomes[:, 1]
+    np.add.at(win_matrix, (player[wins], opponent[wins]), 1.0)
+    np.add.at(win_matrix, (opponent[losses], player[losses]), 1.0)
 
     win_matrix += 1
 
@@ -1,6 +1,8 @@
 import unittest
 from popcore import Interaction
 from poprank.functional.rates import bayeselo, EloRate
+from poprank.functional.rates._bayeselo.core import BayesEloRating
+from poprank.functional.rates._bayeselo.data import BayesEloStats
 
 from fixtures.loader import load_fixture
 
@@ -183,4 +185,46 @@ class TestBayeseloFunctional(unittest.TestCase):
             [round(x.mu) for x in results]
         )
 
+    def test_jacobi_updates_match_the_default_updates(self):
+        games = load_fixture("computer_chess.short")
+        players = list(dict.fromkeys(p for x in games for p in x[:2]))
+        interactions = [
+            Interaction(players=[x[0], x[1]],
+                        outcomes=self.outcome_to_numeric(x[2]))
+            for x in games]
+        elos = [EloRate(0., 0.) for _ in players]
+
+        expected = bayeselo(players, interactions, elos)
+        results = bayeselo(players, interactions, elos, jacobi=True)
+
+        for result, elo in zip(results, expected):
+            self.assertAlmostEqual(result.mu, elo.mu, delta=.5)
+
+    def test_the_initial_elos_are_not_modified(self):
+        players = ["a", "b"]
+        interactions = [Interaction(players=players, outcomes=(1, 0))]
+        elos = [EloRate(0., 0.) for x in players]
+        bayeselo(players, interactions, elos)
+        self.assertListEqual([0., 0.], [x.mu for x in elos])
+
+    def test_rescale_elos_does_not_modify_the_given_elos(self):
+        players = ["a", "b"]
+        elos = [EloRate(100., 0.), EloRate(-100., 0.)]
+        rating = BayesEloRating(
+            BayesEloStats.from_interactions(
+                players, [Interaction(players=players, outcomes=(1, 0))]),
+            elos=elos)
+
+        rating.rescale_elos()
+
+        self.assertListEqual([100., -100.], [x.mu for x in elos])
+        self.assertLess(rating.elos[0].mu, 100.)
+
+    def test_interaction_with_unknown_player_raises_error(self):
+        players = ["a", "b"]
+        interactions = [Interaction(players=["a", "c"], outcomes=(0, 1))]
+        elos = [EloRate(0., 0.) for x in players]
+        self.assertRaises(
+            ValueError, bayeselo, players, interactions, elos)
+
 # TODO: Test that it works for players that already have a rating
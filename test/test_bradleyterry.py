@@ -0,0 +1,91 @@
+import unittest
+from popcore import Interaction
+from poprank import Rate
+
+from poprank.functional.rates.experimental import bradleyterry
+from poprank.utils import InteractionBatch
+
+
+class TestBradleyTerryRating(unittest.TestCase):
+    def test_strengths_match_observed_wins(self):
+        """At the maximum likelihood estimate the expected number of wins
+        of every player equals its observed number of wins"""
+        players = ["a", "b", "c"]
+        interactions = \
+            [Interaction(["a", "b"], [1, 0]) for _ in range(3)] + \
+            [Interaction(["b", "a"], [1, 0])] + \
+            [Interaction(["b", "c"], [1, 0]) for _ in range(2)] + \
+            [Interaction(["c", "b"], [1, 0])] + \
+            [Interaction(["a", "c"], [.5, .5])]
+
+        rates = bradleyterry(players, interactions, iterations=500)
+        pi = dict(zip(players, (rate.mu for rate in rates)))
+
+        expected = dict.fromkeys(players, 0.)
+        observed = dict.fromkeys(players, 0.)
+        for interaction in interactions:
+            p, o = interaction.players
+            expected[p] += pi[p] / (pi[p] + pi[o])
+            expected[o] += pi[o] / (pi[p] + pi[o])
+            observed[p] += interaction.outcomes[0]
+            observed[o] += interaction.outcomes[1]
+
+        for player in players:
+            self.assertAlmostEqual(expected[player], observed[player])
+        self.assertAlmostEqual(sum(pi.values()), 1.)
+        self.assertGreater(pi["a"], pi["b"])
+        self.assertGreater(pi["b"], pi["c"])
+
+    def test_newman_iteration_converges_to_the_mm_strengths(self):
+        players = ["a", "b", "c"]
+        interactions = \
+            [Interaction(["a", "b"], [1, 0]) for _ in range(3)] + \
+            [Interaction(["b", "a"], [1, 0])] + \
+            [Interaction(["b", "c"], [1, 0]) for _ in range(2)] + \
+            [Interaction(["c", "b"], [1, 0])] + \
+            [Interaction(["a", "c"], [.5, .5])]
+
+        expected = bradleyterry(players, interactions, iterations=500)
+        rates = bradleyterry(
+            players, interactions, iterations=100, newman=True)
+
+        for rate, expected_rate in zip(rates, expected):
+            self.assertAlmostEqual(rate.mu, expected_rate.mu)
+
+    def test_non_positive_initial_strengths_raise_error(self):
+        players = ["a", "b"]
+        interactions = [Interaction(["a", "b"], [1, 0])]
+        self.assertRaises(
+            ValueError, bradleyterry, players, interactions,
+            [Rate() for _ in players])
+
+    def test_strengths_without_interactions_are_the_initial_ones(self):
+        players = ["a", "b", "c"]
+        rates = bradleyterry(players, [], [Rate(1.), Rate(2.), Rate(1.)])
+        self.assertListEqual([.25, .5, .25], [rate.mu for rate in rates])
+
+        rates = bradleyterry(
+            players, [Interaction(["a", "b"], [1, 0])],
+            [Rate(1.), Rate(1.), Rate(2.)], normalize=False)
+        self.assertEqual(2., rates[2].mu)
+
+    def test_newman_iteration_rejects_non_positive_initial_strengths(self):
+        players = ["a", "b"]
+        interactions = [Interaction(["a", "b"], [1, 0])]
+        self.assertRaises(
+            ValueError, bradleyterry, players, interactions,
+            [Rate() for _ in players], newman=True)
+
+    def test_outcomes_that_are_not_shares_of_a_win_raise_error(self):
+        players = ["a", "b"]
+        for outcomes in [[3, 1], [-1, 2], [.5, 0]]:
+            for newman in [False, True]:
+                self.assertRaises(
+                    ValueError, bradleyterry, players,
+                    [Interaction(["a", "b"], outcomes)], newman=newman)
+
+    def test_batch_indexed_like_other_players_raises_error(self):
+        batch = InteractionBatch.from_interactions(
+            ["a", "b", "c"], [Interaction(["a", "b"], [1, 0])])
+        for players in [["c", "b", "a"], ["a", "b"]]:
+            self.assertRaises(ValueError, bradleyterry, players, batch)
@@ -1,7 +1,11 @@
 import unittest
+import numpy as np
 
 from popcore import Interaction
-from poprank.functional.rates.elo import elo, EloRate
+from poprank.functional.rates.elo import (
+    elo, elo_mu, EloRate, EloRateSequence
+)
+from poprank.utils import IndexedPlayers, InteractionBatch
 
 
 class TestEloFunctional(unittest.TestCase):
@@ -75,6 +79,125 @@ class TestEloFunctional(unittest.TestCase):
         )
         self.assertEqual(round(elos[0].mu), 1601)
 
+    def test_rate_sequence_matches_rate_list(self):
+        players = ["A", "B", "C", "D", "E", "F"]
+        interactions = [
+            Interaction(["A", "B"], [0.0, 1.0]),
+            Interaction(["A", "C"], [0.5, 0.5]),
+            Interaction(["A", "D"], [1.0, 0.0]),
+            Interaction(["A", "E"], [1.0, 0.0]),
+            Interaction(["A", "F"], [0.0, 1.0])
+        ]
+        initial = [EloRate(mu) for mu in [1613, 1609, 1477, 1388, 1586, 1720]]
+
+        for reduce in ["aggregate", "stream"]:
+            expected = elo(players, interactions, initial, 32, reduce=reduce)
+            elos = elo(players, interactions,
+                       EloRateSequence.from_rates(initial), 32, reduce=reduce)
+
+            self.assertIsInstance(elos, EloRateSequence)
+            self.assertListEqual(list(elos), expected)
+
+    def test_indexed_players_match_player_list(self):
+        players = ["A", "B", "C"]
+        interactions = [
+            Interaction(["A", "B"], [1.0, 0.0]),
+            Interaction(["C", "A"], [0.5, 0.5])
+        ]
+        initial = [EloRate(1500), EloRate(1400), EloRate(1300)]
+
+        self.assertListEqual(
+            elo(IndexedPlayers(players), interactions, initial),
+            elo(players, interactions, initial)
+        )
+
+    def test_interaction_batch_matches_interaction_list(self):
+        players = ["A", "B", "C"]
+        interactions = [
+            Interaction(["A", "B"], [1.0, 0.0]),
+            Interaction(["C", "A"], [0.5, 0.5])
+        ]
+        batch = InteractionBatch.from_interactions(players, interactions)
+        initial = [EloRate(1500), EloRate(1400), EloRate(1300)]
+
+        for reduce in ["aggregate", "stream"]:
+            self.assertListEqual(
+                elo(players, batch, initial, reduce=reduce),
+                elo(players, interactions, initial, reduce=reduce)
+            )
+
+    def test_batch_indexed_like_other_players_raises_error(self):
+        """A batch of other players, or in another order, would rate the
+        wrong players"""
+        interactions = [Interaction(["a", "b"], [1, 0])]
+        batch = InteractionBatch.from_interactions(["a", "b", "c"],
+                                                   interactions)
+        initial = [EloRate(1500), EloRate(1400), EloRate(1300)]
+
+        for players in [["c", "b", "a"], ["a", "b"]]:
+            with self.assertRaises(ValueError):
+                elo(players, batch, initial[:len(players)])
+            with self.assertRaises(ValueError):
+                elo_mu(players, batch, np.zeros(len(players)))
+        # The same players, indexed or not, are accepted
+        elo(IndexedPlayers(["a", "b", "c"]), batch, initial)
+
+    def test_interaction_batch_keeps_close_scores_apart(self):
+        """Outcomes are gathered in float64, in which 1 + 1e-9 > 1"""
+        players = ["A", "B"]
+        interactions = [Interaction(["A", "B"], [1 + 1e-9, 1.])]
+        batch = InteractionBatch.from_interactions(players, interactions)
+        initial = [EloRate(1500), EloRate(1500)]
+
+        self.assertEqual(batch.outcomes.dtype, np.float64)
+        for reduce in ["aggregate", "stream"]:
+            self.assertListEqual(
+                elo(players, batch, initial, wdl=True, reduce=reduce),
+                elo(players, [Interaction(["A", "B"], [1, 0])], initial,
+                    reduce=reduce)
+            )
+
+    def test_elo_mu_matches_elo(self):
+        players = ["A", "B", "C"]
+        interactions = [
+            Interaction(["A", "B"], [1.0, 0.0]),
+            Interaction(["C", "A"], [0.5, 0.5])
+        ]
+        mus = np.array([1500., 1400., 1300.])
+
+        expected = elo(players, interactions, [EloRate(mu) for mu in mus])
+        self.assertListEqual(
+            elo_mu(players, interactions, mus).tolist(),
+            [rate.mu for rate in expected]
+        )
+
+    def test_float32_rate_sequence_stays_float32(self):
+        players = ["A", "B", "C"]
+        interactions = [
+            Interaction(["A", "B"], [1.0, 0.0]),
+            Interaction(["B", "C"], [0.5, 0.5])
+        ]
+        initial = [EloRate(1500), EloRate(1400), EloRate(1300)]
+
+        expected = elo(players, interactions, initial, 32)
+        elos = elo(players, interactions, EloRateSequence.from_rates(
+            initial, np.float32), 32)
+
+        self.assertEqual(elos.mus.dtype, np.float32)
+        for rate, expected_rate in zip(elos, expected):
+            self.assertAlmostEqual(rate.mu, expected_rate.mu, places=3)
+
+    def test_updated_elos_keep_their_base_and_spread(self):
+        players = ["A", "B"]
+        interactions = [Interaction(["A", "B"], [1.0, 0.0])]
+        initial = [EloRate(0, 0, 2, 100), EloRate(0, 0, 2, 100)]
+
+        for reduce in ["aggregate", "stream"]:
+            elos = elo(players, interactions, initial, 32, reduce=reduce)
+            for rate in elos:
+                self.assertEqual((rate.base, rate.spread), (2, 100))
+            self.assertAlmostEqual(elos[0].mu, 16)
+
     def test_winning_increases_elo(self) -> None:
         """Default single interaction win case"""
         self._assert_elo_from_interactions(
@@ -253,3 +376,79 @@ class TestEloInterface(unittest.TestCase):
             elos,
             [EloRate(e, 0) for e in expected_elos]
         )
+
+    def test_stream_converts_outcomes_to_windrawlose_format(self):
+        players = ["a", "b", "c"]
+        elos = [EloRate(1613, 0), EloRate(1609, 0), EloRate(1477, 0)]
+
+        scores = elo(players, [
+            Interaction(["a", "b"], [8, 10]),
+            Interaction(["a", "c"], [0, 0]),
+            Interaction(["b", "c"], [9, -3.8])
+        ], elos, k_factor=32, wdl=True, reduce="stream")
+        expected = elo(players, [
+            Interaction(["a", "b"], [0, 1]),
+            Interaction(["a", "c"], [.5, .5]),
+            Interaction(["b", "c"], [1, 0])
+        ], elos, k_factor=32, reduce="stream")
+
+        self.assertListEqual(
+            [rate.mu for rate in scores],
+            [rate.mu for rate in expected]
+        )
+
+    def test_stream_converts_batched_outcomes_to_windrawlose_format(self):
+        players = ["a", "b", "c"]
+        elos = EloRateSequence.from_rates(
+            [EloRate(1613, 0), EloRate(1609, 0), EloRate(1477, 0)])
+        interactions = InteractionBatch.from_interactions(players, [
+            Interaction(["a", "b"], [8, 10]),
+            Interaction(["a", "c"], [0, 0]),
+            Interaction(["b", "c"], [9, -3.8])
+        ])
+
+        scores = elo(players, interactions, elos, k_factor=32, wdl=True,
+                     reduce="stream")
+        expected = elo(players, [
+            Interaction(["a", "b"], [0, 1]),
+            Interaction(["a", "c"], [.5, .5]),
+            Interaction(["b", "c"], [1, 0])
+        ], list(elos), k_factor=32, reduce="stream")
+
+        self.assertIsInstance(scores, EloRateSequence)
+        for rate, expected_rate in zip(scores, expected):
+            self.assertAlmostEqual(rate.mu, expected_rate.mu)
+
+    def test_stream_does_not_use_raw_scores_with_windrawlose(self):
+        """reduce="stream" used to ignore wdl and update with the raw
+        scores"""
+        players = ["a", "b"]
+        elos = [EloRate(1500, 0), EloRate(1500, 0)]
+        interactions = [Interaction(["a", "b"], [3, 1])]
+
+        scores = elo(players, interactions, elos, k_factor=32, wdl=True,
+                     reduce="stream")
+
+        expected = elo(players, [Interaction(["a", "b"], [1, 0])], elos,
+                       k_factor=32, reduce="stream")
+
+        self.assertEqual(scores[0].mu, 1516.)
+        self.assertListEqual(
+            [rate.mu for rate in scores], [rate.mu for rate in expected])
+
+
+class TestEloRate(unittest.TestCase):
+
+    def test_predict_returns_the_players_expected_score(self):
+        """The stronger player is expected to score more than half"""
+        strong, weak = EloRate(1600, 0), EloRate(1400, 0)
+
+        self.assertAlmostEqual(
+            strong.predict(weak), 1 / (1 + 10 ** (-200 / 400)))
+        self.assertAlmostEqual(
+            weak.predict(strong), 1 / (1 + 10 ** (200 / 400)))
+        self.assertGreater(strong.predict(weak), .5)
+
+    def test_predict_uses_the_players_base_and_spread(self):
+        self.assertAlmostEqual(
+            EloRate(100, 0, 2, 100).predict(EloRate(0, 0, 2, 100)), 2 / 3)
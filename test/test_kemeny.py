@@ -0,0 +1,50 @@
+import unittest
+from itertools import permutations
+import numpy as np
+from popcore import Interaction
+
+from poprank.functional.rates.experimental import kemeny_young
+from poprank.functional.rates.experimental.kemeny import (
+    _kemeny_ilp, _kemeny_subsets
+)
+
+
+class TestKemenyYoung(unittest.TestCase):
+    def test_ranks_a_consistent_tournament_in_order(self):
+        players = ["a", "b", "c", "d"]
+        interactions = [
+            Interaction(["a", "b"], [1, 0]),
+            Interaction(["c", "a"], [0, 1]),
+            Interaction(["a", "d"], [1, 0]),
+            Interaction(["b", "c"], [1, 0]),
+            Interaction(["d", "b"], [0, 1]),
+            Interaction(["c", "d"], [.5, .5]),
+            Interaction(["c", "d"], [1, 0]),
+        ]
+        rank = kemeny_young(players, interactions)
+        self.assertListEqual([3, 2, 1, 0], list(rank))
+
+    def test_subsets_and_ilp_find_an_optimal_order(self):
+        """Both searches reach the fewest disagreements of all orders"""
+        def disagreements(preferences, order):
+            return sum(
+                preferences[below, above]
+                for i, above in enumerate(order) for below in order[i+1:])
+
+        rng = np.random.default_rng(0)
+        for _ in range(5):
+            preferences = rng.integers(0, 5, (6, 6)).astype(float)
+            np.fill_diagonal(preferences, 0.)
+            best = min(
+                disagreements(preferences, order)
+                for order in permutations(range(6)))
+
+            self.assertEqual(
+                best, disagreements(preferences, _kemeny_subsets(preferences)))
+            self.assertEqual(
+                best, disagreements(preferences, _kemeny_ilp(preferences)))
+
+    def test_interaction_with_unknown_player_raises_error(self):
+        self.assertRaises(
+            ValueError, kemeny_young, ["a", "b"],
+            [Interaction(["a", "c"], [1, 0])])
@@ -0,0 +1,79 @@
+import sys
+import unittest
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from pathlib import Path
+import numpy as np
+from popcore import Interaction
+
+from poprank.functional.rates import bayeselo, elo, EloRate
+
+from fixtures.loader import load_fixture
+
+
+_EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def _load_example(name: str):
+    """Imports examples/<name>.py, which is not part of the package"""
+    if name not in sys.modules:
+        spec = spec_from_file_location(name, _EXAMPLES / f"{name}.py")
+        # Registered under its name, like the example harness imports it,
+        # so numba's on-disk cache can find it again
+        sys.modules[name] = module_from_spec(spec)
+        spec.loader.exec_module(sys.modules[name])
+    return sys.modules[name]
+
+
+def _outcome(result: str):
+    return {"1-0": (1, 0), "0-1": (0, 1)}.get(result, (.5, .5))
+
+
+@unittest.skipIf(find_spec("numba") is None, "numba is not installed")
+class TestNumbaExamples(unittest.TestCase):
+    """The numba kernels of the examples against the library methods"""
+
+    def setUp(self) -> None:
+        games = load_fixture("computer_chess.short")
+        self.players = list(dict.fromkeys(p for x in games for p in x[:2]))
+        self.interactions = [
+            Interaction(players=[x[0], x[1]], outcomes=_outcome(x[2]))
+            for x in games]
+
+    def test_numba_elo_matches_stream_elo(self):
+        numba_elo = _load_example("numba_elo").numba_elo
+        elos = [EloRate(0., 0., 2., 100.) for _ in self.players]
+
+        expected = elo(self.players, self.interactions, elos, 20,
+                       reduce="stream")
+        results = numba_elo(self.players, self.interactions, elos, 20)
+        from_array = numba_elo(
+            self.players, self.interactions, np.zeros(len(self.players)),
+            20, base=2., spread=100.)
+
+        for result, array_result, expected_rate in zip(
+                results, from_array, expected):
+            self.assertAlmostEqual(result.mu, expected_rate.mu, places=6)
+            self.assertAlmostEqual(array_result.mu, expected_rate.mu,
+                                   places=6)
+            self.assertEqual((result.base, result.spread), (2., 100.))
+
+    def test_numba_bayeselo_matches_bayeselo(self):
+        numba_bayeselo = _load_example("numba_bayeselo").numba_bayeselo
+
+        for jacobi in [False, True]:
+            elos = [EloRate(0., 0.) for _ in self.players]
+            expected = bayeselo(
+                self.players, self.interactions, elos, jacobi=jacobi)
+            results = numba_bayeselo(
+                self.players, self.interactions, elos, jacobi=jacobi)
+
+            for result, expected_rate in zip(results, expected):
+                self.assertAlmostEqual(result.mu, expected_rate.mu, places=6)
+
+    def test_numba_bayeselo_rejects_unknown_players(self):
+        numba_bayeselo = _load_example("numba_bayeselo").numba_bayeselo
+        players = self.players[1:]
+
+        with self.assertRaises(ValueError):
+            numba_bayeselo(players, self.interactions,
+                           np.zeros(len(players)))
@@ -1,6 +1,9 @@
 import unittest
 
-from poprank import Rank
+import numpy as np
+from popcore import Population
+
+from poprank import Rank, Rate, RateModule
 
 
 class TestRank(unittest.TestCase):
@@ -24,8 +27,34 @@ class TestRank(unittest.TestCase):
         self.assertEqual(true_inverse ** -1, rank)
         self.assertEqual((rank ** -1) ** -1, rank)
 
+    def test_composition_into_preallocated_buffer(self):
+        rank = Rank([1, 4, 3, 2, 0])
+        out = np.empty(5, dtype=np.intp)
+
+        composed = rank.compose(rank ** -1, out=out)
+
+        self.assertEqual(composed, Rank([0, 1, 2, 3, 4]))
+        self.assertTrue(np.shares_memory(np.asarray(composed), out))
+
+
 class TestRankIntegration(unittest.TestCase):
     """
         Verify the intergration of ratings, ranks, and metrics.
     """
     pass
+
+
+class TestRateModule(unittest.TestCase):
+
+    class _Constant(RateModule[Rate]):
+        def _rate(self, interactions, **kwds):
+            return self.rates
+
+    def test_default_rates_are_mutable(self):
+        module = self._Constant(
+            Population.from_players_uid(None, ["a", "b"]), default_rate=2.)
+
+        module.rates[0].mu = 5.
+        module.rates.append(Rate(3.))
+
+        self.assertListEqual([5., 2., 3.], [r.mu for r in module.rates])